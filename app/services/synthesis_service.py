@@ -16,11 +16,13 @@ here, keeping the API endpoint thin.
 from __future__ import annotations
 
 import base64
-import io
+import math
+import struct
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Optional
 
 import numpy as np
-import soundfile as sf
 from loguru import logger
 
 from app.schemas.translation import (
@@ -42,15 +44,23 @@ from src.engine.dsp_processor import (
     map_intent_to_va,
 )
 
+# ── Optional: soxr for fast HQ resampling (installed with librosa) ───────
+try:
+    import soxr
+
+    HAS_SOXR = True
+except ImportError:
+    HAS_SOXR = False
+
 # ── Emotion → Intent mapping ─────────────────────────────────────────────
 # The Phase 0 LLM returns a coarse emotion_category; we map it to the
 # finer-grained bioacoustic intents used by the DSP engine's VA space.
-EMOTION_TO_INTENT: dict[str, str] = {
+EMOTION_TO_INTENT: Mapping[str, str] = MappingProxyType({
     "Hungry": "Requesting",
     "Angry": "Agonistic",
     "Happy": "Affiliative",
     "Alert": "Alert",
-}
+})
 
 # ── Supported output sample rates ────────────────────────────────────────
 VALID_SAMPLE_RATES = {16000, 44100}
@@ -67,6 +77,60 @@ def _emotion_to_intent(emotion_category: str) -> str:
     return intent
 
 
+def _resample(audio: np.ndarray, sr: int, target_sr: int) -> np.ndarray:
+    """Resample mono float32 audio from *sr* to *target_sr*.
+
+    Uses libsoxr's HQ polyphase resampler directly (the same engine and
+    output as ``librosa.resample``'s default, minus librosa's dispatch);
+    falls back to a gcd-reduced ``scipy.signal.resample_poly``.
+    """
+    audio = audio.astype(np.float32, copy=False)
+    if HAS_SOXR:
+        return soxr.resample(audio, sr, target_sr, quality="HQ")
+
+    from scipy.signal import resample_poly
+
+    g = math.gcd(sr, target_sr)
+    return resample_poly(
+        audio, target_sr // g, sr // g, window=("kaiser", 5.0)
+    ).astype(np.float32, copy=False)
+
+
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _pcm16_wav_bytes(audio: np.ndarray, sr: int) -> bytearray:
+    """Build a PCM_16 WAV file in a single preallocated buffer.
+
+    Samples are quantised exactly as libsndfile does for ``PCM_16``
+    (round to 32-bit, arithmetic shift down to 16, clip), so the bytes
+    match ``sf.write(..., subtype="PCM_16")``.  *audio* is mono, or
+    ``(frames, channels)``.
+    """
+    audio = np.asarray(audio)
+    if audio.dtype not in (np.float32, np.float64):
+        audio = audio.astype(np.float32)
+    channels = 1 if audio.ndim == 1 else audio.shape[1]
+    nbytes = audio.size * 2
+
+    wav = bytearray(_WAV_HEADER.size + nbytes)
+    _WAV_HEADER.pack_into(
+        wav, 0,
+        b"RIFF", _WAV_HEADER.size - 8 + nbytes, b"WAVE",
+        b"fmt ", 16, 1, channels, sr, sr * channels * 2, channels * 2, 16,
+        b"data", nbytes,
+    )
+    # Power-of-two scaling keeps every step exact in the input precision.
+    one = audio.dtype.type
+    scaled = audio.reshape(-1) * one(2.0**31)
+    np.rint(scaled, out=scaled)
+    scaled *= one(2.0**-16)
+    np.floor(scaled, out=scaled)
+    np.clip(scaled, -32768, 32767, out=scaled)
+    np.frombuffer(wav, dtype="<i2", offset=_WAV_HEADER.size)[:] = scaled
+    return wav
+
+
 def _encode_audio_base64(
     audio: np.ndarray,
     sr: int,
@@ -103,17 +167,10 @@ def _encode_audio_base64(
 
     # Resample if needed
     if sr != target_sr:
-        import librosa
-
-        audio = librosa.resample(audio.astype(np.float32), orig_sr=sr, target_sr=target_sr)
+        audio = _resample(audio, int(sr), int(target_sr))
         sr = target_sr
 
-    # Write to in-memory WAV buffer
-    buf = io.BytesIO()
-    sf.write(buf, audio, sr, format="WAV", subtype="PCM_16")
-    buf.seek(0)
-
-    encoded = base64.b64encode(buf.read()).decode("ascii")
+    encoded = base64.b64encode(_pcm16_wav_bytes(audio, sr)).decode("ascii")
     logger.debug("Encoded audio: {} bytes base64 @ {} Hz", len(encoded), sr)
     return encoded
 
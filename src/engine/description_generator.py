@@ -36,6 +36,7 @@ Usage::
 
 from __future__ import annotations
 
+import bisect
 import math
 from dataclasses import dataclass
 from typing import Optional
@@ -44,6 +45,15 @@ from loguru import logger
 
 from src.engine.dsp_processor import INTENT_VA_MAP, SampleMatch, VAPoint
 
+# Descriptor tables are stored column-wise: sorted thresholds + parallel labels.
+DescriptorTable = tuple[tuple[float, ...], tuple[str, ...]]
+
+
+def _descriptor_table(pairs: list[tuple[float, str]]) -> DescriptorTable:
+    """Split sorted (threshold, label) pairs into parallel key/label tuples."""
+    keys, labels = zip(*pairs)
+    return tuple(keys), tuple(labels)
+
 
 # ── Intent → 中文语义标签 ───────────────────────────────────────────────
 INTENT_CN_LABELS: dict[str, str] = {
@@ -67,17 +77,17 @@ CONTEXT_CN_LABELS: dict[str, str] = {
 }
 
 # ── Arousal → 描述性词汇 ────────────────────────────────────────────────
-_AROUSAL_DESCRIPTORS: list[tuple[float, str]] = [
+_AROUSAL_DESCRIPTORS: DescriptorTable = _descriptor_table([
     (0.0, "极平静的"),
     (0.2, "舒缓低沉的"),
     (0.4, "平稳的"),
     (0.6, "中等活跃的"),
     (0.8, "高亢激昂的"),
     (0.9, "极度紧迫的"),
-]
+])
 
 # ── Valence → 情感色彩 ──────────────────────────────────────────────────
-_VALENCE_DESCRIPTORS: list[tuple[float, str]] = [
+_VALENCE_DESCRIPTORS: DescriptorTable = _descriptor_table([
     (-1.0, "强烈消极"),
     (-0.5, "消极"),
     (-0.2, "略带消极"),
@@ -85,10 +95,10 @@ _VALENCE_DESCRIPTORS: list[tuple[float, str]] = [
     (0.2, "略带积极"),
     (0.5, "积极"),
     (1.0, "强烈积极"),
-]
+])
 
 # ── Pitch shift → 音调描述 ──────────────────────────────────────────────
-_PITCH_DESCRIPTORS: list[tuple[float, str]] = [
+_PITCH_DESCRIPTORS: DescriptorTable = _descriptor_table([
     (-12.0, "大幅降调"),
     (-6.0, "明显降调"),
     (-2.0, "微幅降调"),
@@ -96,7 +106,7 @@ _PITCH_DESCRIPTORS: list[tuple[float, str]] = [
     (2.0, "微幅升调"),
     (6.0, "明显升调"),
     (12.0, "大幅升调"),
-]
+])
 
 # ── Vocalisation type heuristics ────────────────────────────────────────
 _VOCALISATION_TYPES: dict[str, str] = {
@@ -118,16 +128,20 @@ _VOCALISATION_TYPES: dict[str, str] = {
 # ══════════════════════════════════════════════════════════════════════════
 
 
-def _lookup_descriptor(value: float, table: list[tuple[float, str]]) -> str:
-    """Find the closest descriptor from a sorted (threshold, label) table."""
-    best_label = table[0][1]
-    best_dist = abs(value - table[0][0])
-    for threshold, label in table[1:]:
-        dist = abs(value - threshold)
-        if dist < best_dist:
-            best_dist = dist
-            best_label = label
-    return best_label
+def _lookup_descriptor(value: float, table: DescriptorTable) -> str:
+    """Find the closest descriptor via binary search over sorted thresholds.
+
+    On a tie between neighbouring thresholds the lower one wins.
+    """
+    keys, labels = table
+    i = bisect.bisect_left(keys, value)
+    if i == 0:
+        return labels[0]
+    if i == len(keys):
+        return labels[-1]
+    if abs(value - keys[i - 1]) <= abs(keys[i] - value):
+        return labels[i - 1]
+    return labels[i]
 
 
 def _compute_confidence_score(distance: float) -> float:
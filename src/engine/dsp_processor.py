@@ -74,7 +74,7 @@ REGISTRY_PATH = ASSETS_DIR / "audio_db" / "registry.json"
 # ════════════════════════════════════════════════════════════════════════
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VAPoint:
     """A point in the two-dimensional Valence–Arousal affective space.
 
@@ -5,7 +5,6 @@ from __future__ import annotations
 import math
 import threading
 import time
-from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass
 
@@ -37,15 +36,20 @@ class AudioRecorder:
         self.on_chunk = on_chunk
         self.is_recording = False
         self._stream = None
+        # Guards ``_recorded`` rotation only; the audio callback never blocks on it.
         self._lock = threading.Lock()
-        self._waveform = deque(maxlen=self.config.waveform_window)
+        # Single-producer ring buffer: the callback writes, then publishes by
+        # bumping ``_widx`` (total samples written); readers snapshot the index.
+        self._waveform = np.zeros(self.config.waveform_window, dtype=np.float32)
+        self._widx = 0
         self._recorded = bytearray()
         self._fallback_thread: threading.Thread | None = None
         self._fallback_stop = threading.Event()
 
     def start(self) -> None:
         self.is_recording = True
-        self._recorded.clear()
+        with self._lock:
+            self._recorded.clear()
         if sd is None:
             self._start_fallback_waveform()
             return
@@ -65,26 +69,55 @@ class AudioRecorder:
             self._stream.close()
             self._stream = None
         self._fallback_stop.set()
-        return bytes(self._recorded)
+        with self._lock:
+            recorded = bytes(self._recorded)
+            self._recorded = bytearray()
+        return recorded
 
     def snapshot_waveform(self, points: int = 64) -> list[float]:
-        with self._lock:
-            values = list(self._waveform)
-        if not values:
+        # Lock-free read: a torn frame is invisible in a waveform display.
+        widx = self._widx
+        ring = self._waveform
+        if widx == 0:
             return [0.0] * points
-        array = np.array(values, dtype=np.float32)
+        window = len(ring)
+        if widx < window:
+            array = ring[:widx].copy()
+        else:
+            start = widx % window
+            array = np.concatenate((ring[start:], ring[:start]))
         buckets = np.array_split(array, points)
         return [float(np.mean(np.abs(bucket))) if len(bucket) else 0.0 for bucket in buckets]
 
     def _on_audio_frame(self, indata, frames, _time_info, _status) -> None:
-        chunk = indata[:, 0].copy()
-        pcm_bytes = chunk.tobytes()
-        with self._lock:
-            self._recorded.extend(pcm_bytes)
-            self._waveform.extend((chunk.astype(np.float32) / 32768.0).tolist())
+        # ``indata`` is only valid during the callback; ``tobytes`` and
+        # ``astype`` each copy out of it, so no defensive copy is needed.
+        column = indata[:, 0]
+        pcm_bytes = column.tobytes()
+        self._recorded.extend(pcm_bytes)
+        samples = column.astype(np.float32)
+        samples /= 32768.0
+        self._write_waveform(samples)
         if self.on_chunk:
             self.on_chunk(pcm_bytes)
 
+    def _write_waveform(self, samples: np.ndarray) -> None:
+        ring = self._waveform
+        window = len(ring)
+        total = len(samples)
+        if total >= window:
+            samples = samples[-window:]
+        count = len(samples)
+        start = (self._widx + total - count) % window
+        end = start + count
+        if end <= window:
+            ring[start:end] = samples
+        else:
+            split = window - start
+            ring[start:] = samples[:split]
+            ring[: end - window] = samples[split:]
+        self._widx += total
+
     def _start_fallback_waveform(self) -> None:
         self._fallback_stop.clear()
         if self._fallback_thread and self._fallback_thread.is_alive():
@@ -94,8 +127,7 @@ class AudioRecorder:
             t = 0.0
             while not self._fallback_stop.is_set():
                 simulated = math.sin(t) * 0.8
-                with self._lock:
-                    self._waveform.extend([simulated] * 64)
+                self._write_waveform(np.full(64, simulated, dtype=np.float32))
                 t += 0.25
                 time.sleep(0.05)
 
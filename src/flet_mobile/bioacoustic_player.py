@@ -3,16 +3,24 @@
 from __future__ import annotations
 
 import asyncio
-import base64
+import hashlib
 import io
 import json
+import math
+import os
 from pathlib import Path
 from typing import Any
 
 import flet as ft
+import flet_audio as fta
 import librosa
 import numpy as np
 import soundfile as sf
+from scipy.signal import resample_poly
+
+_FACTOR_EPS = 1e-3
+# Rendered-WAV cache budget; least recently played files are pruned first.
+_CACHE_MAX_BYTES = 64 * 1024 * 1024
 
 
 class BioacousticPlayer:
@@ -28,23 +36,89 @@ class BioacousticPlayer:
         self.catalog_path = self.repo_root / catalog_path
         self._sample_index = self._build_index()
         self._fallback_file = self.repo_root / "meow_output.wav"
+        self.cache_dir = self.repo_root / "cache"
+        # Created inside the page context, so the service registers itself.
+        self.audio = fta.Audio(src=None, autoplay=False)
 
     async def play_sound_id(
         self,
         sound_id: str,
         pitch_factor: float = 1.0,
         tempo_factor: float = 1.0,
+        high_quality: bool = False,
     ) -> str:
         source = self._resolve_sound(sound_id)
-        wav_bytes = await asyncio.to_thread(
-            self._process_to_wav_bytes,
-            source,
-            pitch_factor,
-            tempo_factor,
+        cache_path = self._cache_path(source, pitch_factor, tempo_factor, high_quality)
+        if cache_path.exists():
+            wav_bytes = await asyncio.to_thread(self._read_cache, cache_path)
+        else:
+            wav_bytes = await asyncio.to_thread(
+                self._process_to_wav_bytes,
+                source,
+                pitch_factor,
+                tempo_factor,
+                high_quality,
+            )
+            await asyncio.to_thread(self._write_cache, cache_path, wav_bytes)
+
+        # Raw bytes travel over the Flet channel as binary, without base64.
+        self.audio.src = wav_bytes
+        self.audio.update()
+        await self.audio.play()
+        return str(cache_path)
+
+    def _cache_path(
+        self,
+        source: Path,
+        pitch_factor: float,
+        tempo_factor: float,
+        high_quality: bool,
+    ) -> Path:
+        # The source's mtime and size invalidate renders of an edited file.
+        try:
+            stat = source.stat()
+            stamp = f"{stat.st_mtime_ns}:{stat.st_size}"
+        except OSError:
+            stamp = "missing"
+        key = (
+            f"{source}|{stamp}|{pitch_factor:.4f}|{tempo_factor:.4f}"
+            f"|{int(high_quality)}"
         )
-        data_url = "data:audio/wav;base64," + base64.b64encode(wav_bytes).decode("ascii")
-        self.page.launch_url(data_url)
-        return data_url
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.wav"
+
+    @staticmethod
+    def _read_cache(path: Path) -> bytes:
+        data = path.read_bytes()
+        # Refresh atime explicitly; relatime/noatime mounts may not.
+        os.utime(path)
+        return data
+
+    @staticmethod
+    def _write_cache(path: Path, wav_bytes: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(wav_bytes)
+        tmp_path.replace(path)
+        BioacousticPlayer._prune_cache(path.parent)
+
+    @staticmethod
+    def _prune_cache(cache_dir: Path, max_bytes: int = _CACHE_MAX_BYTES) -> None:
+        """Delete least recently used renders until *cache_dir* fits *max_bytes*."""
+        entries = []
+        for entry in os.scandir(cache_dir):
+            if entry.name.endswith(".wav") and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_atime_ns, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
 
     def _build_index(self) -> dict[str, Path]:
         if not self.catalog_path.exists():
@@ -72,16 +146,32 @@ class BioacousticPlayer:
         source: Path,
         pitch_factor: float,
         tempo_factor: float,
+        high_quality: bool = False,
     ) -> bytes:
         y, sr = librosa.load(source, sr=None, mono=True)
         tempo_factor = float(np.clip(tempo_factor, 0.6, 1.8))
         pitch_factor = float(np.clip(pitch_factor, 0.7, 1.5))
-
-        y_stretched = librosa.effects.time_stretch(y, rate=tempo_factor)
         semitones = (pitch_factor - 1.0) * 12.0
-        y_shifted = librosa.effects.pitch_shift(y_stretched, sr=sr, n_steps=semitones)
+        tempo_changed = abs(tempo_factor - 1.0) >= _FACTOR_EPS
+        pitch_changed = abs(pitch_factor - 1.0) >= _FACTOR_EPS
+
+        pitch_ratio = 2.0 ** (semitones / 12.0)
 
+        if tempo_changed and pitch_changed and abs(pitch_ratio - tempo_factor) < _FACTOR_EPS:
+            # Same ratio on both axes is a plain playback-rate change:
+            # one polyphase resample instead of two phase vocoders.
+            down = int(round(1000 * tempo_factor))
+            divisor = math.gcd(1000, down)
+            y = resample_poly(y, up=1000 // divisor, down=down // divisor)
+        else:
+            if tempo_changed:
+                y = librosa.effects.time_stretch(y, rate=tempo_factor)
+            if pitch_changed:
+                y = librosa.effects.pitch_shift(y, sr=sr, n_steps=semitones)
+
+        # 8-bit mu-law halves the payload; the dynamic range loss is
+        # inaudible on phone speakers. PCM_16 remains available on request.
+        subtype = "PCM_16" if high_quality else "ULAW"
         buffer = io.BytesIO()
-        sf.write(buffer, y_shifted, sr, format="WAV")
+        sf.write(buffer, y, sr, format="WAV", subtype=subtype)
         return buffer.getvalue()
-
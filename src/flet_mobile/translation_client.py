@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from collections.abc import AsyncIterable, Awaitable, Callable
 from typing import Any
@@ -10,6 +11,16 @@ from urllib.parse import urlparse
 import httpx
 import websockets
 
+# Pending PCM chunks between the recorder and the WebSocket sender. When the
+# uplink falls behind, new chunks are coalesced into larger frames instead.
+_SEND_QUEUE_SIZE = 8
+# Coalescing stops at ~40 ms of 16 kHz mono PCM16 (the recorder's format);
+# beyond that the producer waits for the sender rather than growing a frame.
+_STREAM_SAMPLE_RATE = 16000
+_STREAM_SAMPLE_WIDTH = 2
+_MAX_COALESCE_SECONDS = 0.04
+_MAX_FRAME_BYTES = int(_STREAM_SAMPLE_RATE * _STREAM_SAMPLE_WIDTH * _MAX_COALESCE_SECONDS)
+
 
 class TranslationClient:
     """API-first client wrapper used by the Flet presentation layer."""
@@ -54,18 +65,75 @@ class TranslationClient:
                 )
             )
 
+            send_task = asyncio.create_task(self._send_chunks(ws, chunks))
+            receive_task = asyncio.create_task(self._receive_events(ws, on_event))
+            try:
+                await asyncio.wait(
+                    {send_task, receive_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if send_task.done():
+                    # Surface chunk-iterator / send failures instead of
+                    # waiting on a result the server will never send.
+                    send_task.result()
+                await receive_task
+            finally:
+                send_task.cancel()
+                receive_task.cancel()
+                await asyncio.gather(send_task, receive_task, return_exceptions=True)
+
+    @staticmethod
+    async def _send_chunks(ws: Any, chunks: AsyncIterable[bytes]) -> None:
+        """Forward chunks through a bounded queue, then send the stop message."""
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=_SEND_QUEUE_SIZE)
+
+        async def produce() -> None:
+            pending = b""
             async for chunk in chunks:
-                await ws.send(chunk)
+                pending += chunk
+                if len(pending) < _MAX_FRAME_BYTES:
+                    try:
+                        queue.put_nowait(pending)
+                    except asyncio.QueueFull:
+                        continue
+                else:
+                    await queue.put(pending)
+                pending = b""
+            if pending:
+                await queue.put(pending)
+            await queue.put(None)
 
-            await ws.send(json.dumps({"type": "stop"}))
+        async def send() -> None:
             while True:
-                message = await ws.recv()
-                if not isinstance(message, str):
-                    continue
-                payload = json.loads(message)
-                await on_event(payload)
-                if payload.get("type") in {"result", "error"}:
-                    break
+                frame = await queue.get()
+                if frame is None:
+                    await ws.send(json.dumps({"type": "stop"}))
+                    return
+                await ws.send(frame)
+
+        tasks = {asyncio.create_task(produce()), asyncio.create_task(send())}
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _receive_events(
+        ws: Any,
+        on_event: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        """Dispatch server messages until a terminal result or error arrives."""
+        while True:
+            message = await ws.recv()
+            if not isinstance(message, str):
+                continue
+            payload = json.loads(message)
+            await on_event(payload)
+            if payload.get("type") in {"result", "error"}:
+                break
 
     def _build_ws_url(self, endpoint: str) -> str:
         parsed = urlparse(self.base_url)
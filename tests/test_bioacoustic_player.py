@@ -0,0 +1,69 @@
+"""
+Unit tests for the Flet client's rendered-WAV cache (bioacoustic_player).
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.flet_mobile.bioacoustic_player import BioacousticPlayer
+
+
+def _player(cache_dir: Path) -> BioacousticPlayer:
+    """Player without a Flet page; only the cache helpers are exercised."""
+    player = BioacousticPlayer.__new__(BioacousticPlayer)
+    player.cache_dir = cache_dir
+    return player
+
+
+class TestRenderCache(unittest.TestCase):
+    """Cache keying and LRU pruning."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.player = _player(self.root / "cache")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_key_changes_when_source_is_replaced(self):
+        source = self.root / "meow.wav"
+        source.write_bytes(b"RIFF" + b"\x00" * 40)
+        before = self.player._cache_path(source, 1.2, 1.0, False)
+        self.assertEqual(before, self.player._cache_path(source, 1.2, 1.0, False))
+
+        source.write_bytes(b"RIFF" + b"\x01" * 80)
+        self.assertNotEqual(before, self.player._cache_path(source, 1.2, 1.0, False))
+
+    def test_prune_evicts_least_recently_used(self):
+        cache_dir = self.root / "cache"
+        cache_dir.mkdir()
+        for index, name in enumerate(("old.wav", "mid.wav", "new.wav")):
+            path = cache_dir / name
+            path.write_bytes(b"\x00" * 100)
+            os.utime(path, (1_000_000 + index, 1_000_000 + index))
+
+        BioacousticPlayer._prune_cache(cache_dir, max_bytes=200)
+        self.assertEqual(
+            sorted(p.name for p in cache_dir.iterdir()), ["mid.wav", "new.wav"]
+        )
+
+    def test_read_refreshes_recency(self):
+        cache_dir = self.root / "cache"
+        cache_dir.mkdir()
+        for index, name in enumerate(("a.wav", "b.wav")):
+            path = cache_dir / name
+            path.write_bytes(b"\x00" * 100)
+            os.utime(path, (1_000_000 + index, 1_000_000 + index))
+
+        BioacousticPlayer._read_cache(cache_dir / "a.wav")
+        BioacousticPlayer._prune_cache(cache_dir, max_bytes=100)
+        self.assertEqual([p.name for p in cache_dir.iterdir()], ["a.wav"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,7 +15,12 @@ Covers:
 from __future__ import annotations
 
 import math
+import re
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import numpy as np
 
 from src.engine.description_generator import (
     CONTEXT_CN_LABELS,
@@ -36,6 +41,38 @@ from src.engine.dsp_processor import INTENT_VA_MAP, SampleMatch, VAPoint
 
 # ── Helpers ──────────────────────────────────────────────────────────────
 
+# Interned VA points reused across tests (VAPoint is frozen).
+_VA_NEUTRAL = VAPoint(valence=0.0, arousal=0.5)
+_VA_REQUESTING = VAPoint(valence=0.3, arousal=0.75)
+
+# Frozen views of the intent map, shared by the per-intent tests.
+_INTENT_ITEMS: tuple[tuple[str, VAPoint], ...] = tuple(INTENT_VA_MAP.items())
+_INTENT_KEYS: tuple[str, ...] = tuple(INTENT_VA_MAP)
+
+# Sections every preview detail must contain, matched in a single scan.
+_DETAIL_SECTIONS: tuple[str, ...] = (
+    "意图映射", "情感空间", "匹配样本", "VA 距离",
+    "音高调整", "时长因子", "目标品种", "发声类型",
+)
+_DETAIL_SECTIONS_RE = re.compile("|".join(map(re.escape, _DETAIL_SECTIONS)))
+
+# Reference confidence values: exp(-distance) for the probed distances.
+_EXPECTED_CONF: dict[float, float] = {
+    d: math.exp(-d) for d in (0.0, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0)
+}
+
+
+_DEFAULT_SAMPLE_MATCH = SampleMatch(
+    sample_id="TEST_001",
+    file_path="test/test_001.wav",
+    distance=0.15,
+    valence=0.3,
+    arousal=0.75,
+    breed="Maine Coon",
+    context="Food",
+    metadata={"id": "TEST_001"},
+)
+
 
 def _make_sample_match(
     distance: float = 0.15,
@@ -45,17 +82,29 @@ def _make_sample_match(
     context: str = "Food",
     sample_id: str = "TEST_001",
 ) -> SampleMatch:
-    """Create a mock SampleMatch for testing."""
-    return SampleMatch(
-        sample_id=sample_id,
-        file_path="test/test_001.wav",
-        distance=distance,
-        valence=valence,
-        arousal=arousal,
-        breed=breed,
-        context=context,
-        metadata={"id": sample_id},
-    )
+    """Create a mock SampleMatch for testing.
+
+    Returns the shared default instance when no field is overridden; the
+    generator only reads from the match, so sharing it is safe.
+    """
+    fields = {
+        "distance": distance,
+        "valence": valence,
+        "arousal": arousal,
+        "breed": breed,
+        "context": context,
+        "sample_id": sample_id,
+    }
+    overrides = {
+        name: value
+        for name, value in fields.items()
+        if value != getattr(_DEFAULT_SAMPLE_MATCH, name)
+    }
+    if not overrides:
+        return _DEFAULT_SAMPLE_MATCH
+    if "sample_id" in overrides:
+        overrides["metadata"] = {"id": sample_id}
+    return replace(_DEFAULT_SAMPLE_MATCH, **overrides)
 
 
 # ════════════════════════════════════════════════════════════════════════
@@ -68,7 +117,7 @@ class TestIntentLabels(unittest.TestCase):
 
     def test_all_intents_have_cn_labels(self) -> None:
         """Every intent in the VA map should have a Chinese label."""
-        for intent in INTENT_VA_MAP:
+        for intent in _INTENT_KEYS:
             self.assertIn(
                 intent,
                 INTENT_CN_LABELS,
@@ -77,7 +126,7 @@ class TestIntentLabels(unittest.TestCase):
 
     def test_all_intents_have_vocalisation_types(self) -> None:
         """Every intent should have a vocalisation type description."""
-        for intent in INTENT_VA_MAP:
+        for intent in _INTENT_KEYS:
             self.assertIn(
                 intent,
                 _VOCALISATION_TYPES,
@@ -100,25 +149,36 @@ class TestConfidenceScore(unittest.TestCase):
 
     def test_perfect_match(self) -> None:
         """Distance = 0 → confidence = 1.0."""
-        self.assertAlmostEqual(_compute_confidence_score(0.0), 1.0)
+        self.assertAlmostEqual(_compute_confidence_score(0.0), _EXPECTED_CONF[0.0])
 
     def test_distance_one(self) -> None:
         """Distance = 1.0 → confidence ≈ e^(-1) ≈ 0.368."""
-        expected = math.exp(-1.0)
-        self.assertAlmostEqual(_compute_confidence_score(1.0), expected, places=3)
+        self.assertAlmostEqual(
+            _compute_confidence_score(1.0), _EXPECTED_CONF[1.0], places=3
+        )
 
     def test_large_distance(self) -> None:
         """Large distance → confidence close to 0."""
         score = _compute_confidence_score(10.0)
+        self.assertAlmostEqual(score, _EXPECTED_CONF[10.0], places=6)
         self.assertLess(score, 0.001)
 
+    def test_matches_exponential_decay(self) -> None:
+        """All probed distances should follow exp(-distance)."""
+        distances = np.array(list(_EXPECTED_CONF))
+        expected = np.array(list(_EXPECTED_CONF.values()))
+        actual = np.array([_compute_confidence_score(d) for d in distances])
+        np.testing.assert_allclose(actual, expected, atol=1e-3)
+
     def test_monotonically_decreasing(self) -> None:
         """Confidence should decrease as distance increases."""
-        prev = 1.0
-        for d in [0.1, 0.5, 1.0, 2.0, 5.0]:
-            score = _compute_confidence_score(d)
-            self.assertLess(score, prev)
-            prev = score
+        distances = np.array([0.0, 0.1, 0.5, 1.0, 2.0, 5.0])
+        scores = np.fromiter(
+            (_compute_confidence_score(d) for d in distances),
+            dtype=float,
+            count=len(distances),
+        )
+        self.assertTrue(np.all(np.diff(scores) < 0))
 
 
 # ════════════════════════════════════════════════════════════════════════
@@ -146,10 +206,10 @@ class TestConfidenceLevel(unittest.TestCase):
 
     def test_boundary_values(self) -> None:
         """Test exact boundary thresholds."""
-        self.assertEqual(_confidence_level_cn(0.90), "极高")
-        self.assertEqual(_confidence_level_cn(0.70), "高")
-        self.assertEqual(_confidence_level_cn(0.50), "中等")
-        self.assertEqual(_confidence_level_cn(0.30), "较低")
+        boundaries = np.array([0.90, 0.70, 0.50, 0.30])
+        expected = np.array(["极高", "高", "中等", "较低"])
+        got = np.array([_confidence_level_cn(x) for x in boundaries])
+        np.testing.assert_array_equal(got, expected)
 
 
 # ════════════════════════════════════════════════════════════════════════
@@ -189,6 +249,17 @@ class TestDescriptorLookup(unittest.TestCase):
         desc = _lookup_descriptor(10.0, _PITCH_DESCRIPTORS)
         self.assertEqual(desc, "大幅升调")
 
+    def test_matches_linear_nearest_scan(self) -> None:
+        """Binary search should agree with a nearest-threshold linear scan."""
+        for table in (_AROUSAL_DESCRIPTORS, _VALENCE_DESCRIPTORS, _PITCH_DESCRIPTORS):
+            keys, labels = table
+            self.assertEqual(list(keys), sorted(keys))
+            probes = [*keys, *(k + 0.05 for k in keys), *(k - 0.05 for k in keys)]
+            for value in probes:
+                # min() keeps the first (lowest) threshold on ties.
+                nearest = min(range(len(keys)), key=lambda i: abs(value - keys[i]))
+                self.assertEqual(_lookup_descriptor(value, table), labels[nearest])
+
 
 # ════════════════════════════════════════════════════════════════════════
 #  5. Full Preview Description Tests
@@ -198,10 +269,15 @@ class TestDescriptorLookup(unittest.TestCase):
 class TestGeneratePreviewDescription(unittest.TestCase):
     """Tests for generate_preview_description."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.default_match = _make_sample_match()
+        cls.default_va = _VA_NEUTRAL
+
     def test_basic_generation(self) -> None:
         """Should produce a non-empty PreviewDescription."""
-        match = _make_sample_match()
-        target_va = VAPoint(valence=0.30, arousal=0.75)
+        match = self.default_match
+        target_va = _VA_REQUESTING
 
         desc = generate_preview_description(
             intent="Requesting",
@@ -220,7 +296,7 @@ class TestGeneratePreviewDescription(unittest.TestCase):
 
     def test_summary_contains_key_info(self) -> None:
         """Summary should mention intent label, breed, and confidence."""
-        match = _make_sample_match(distance=0.05)
+        match = replace(self.default_match, distance=0.05)
         target_va = VAPoint(valence=0.70, arousal=0.35)
 
         desc = generate_preview_description(
@@ -236,13 +312,12 @@ class TestGeneratePreviewDescription(unittest.TestCase):
 
     def test_confidence_score_in_range(self) -> None:
         """Confidence score should be in [0, 1]."""
-        match = _make_sample_match(distance=0.5)
-        target_va = VAPoint(valence=0.0, arousal=0.5)
+        match = replace(self.default_match, distance=0.5)
 
         desc = generate_preview_description(
             intent="Neutral",
             match=match,
-            target_va=target_va,
+            target_va=self.default_va,
         )
 
         self.assertGreaterEqual(desc.confidence_score, 0.0)
@@ -250,7 +325,7 @@ class TestGeneratePreviewDescription(unittest.TestCase):
 
     def test_detail_has_all_sections(self) -> None:
         """Detail text should contain all analysis sections."""
-        match = _make_sample_match()
+        match = self.default_match
         target_va = VAPoint(valence=-0.80, arousal=0.90)
 
         desc = generate_preview_description(
@@ -259,28 +334,33 @@ class TestGeneratePreviewDescription(unittest.TestCase):
             target_va=target_va,
         )
 
-        for section in ["意图映射", "情感空间", "匹配样本", "VA 距离",
-                        "音高调整", "时长因子", "目标品种", "发声类型"]:
-            self.assertIn(section, desc.detail, f"Missing section: {section}")
+        found = set(_DETAIL_SECTIONS_RE.findall(desc.detail))
+        missing = set(_DETAIL_SECTIONS) - found
+        self.assertFalse(missing, f"Missing sections: {missing}")
 
     def test_all_intents_generate_descriptions(self) -> None:
         """Every known intent should produce a valid description."""
-        match = _make_sample_match()
+        match = self.default_match
 
-        for intent, va in INTENT_VA_MAP.items():
-            desc = generate_preview_description(
-                intent=intent,
-                match=match,
-                target_va=va,
+        def describe(item):
+            intent, target_va = item
+            return intent, generate_preview_description(
+                intent=intent, match=match, target_va=target_va
             )
-            self.assertIsInstance(desc, PreviewDescription)
-            self.assertTrue(len(desc.summary) > 0)
-            self.assertTrue(len(desc.intent_label) > 0)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(describe, _INTENT_ITEMS))
+
+        for intent, desc in results:
+            with self.subTest(intent=intent):
+                self.assertIsInstance(desc, PreviewDescription)
+                self.assertTrue(len(desc.summary) > 0)
+                self.assertTrue(len(desc.intent_label) > 0)
 
     def test_tempo_descriptions(self) -> None:
         """Different duration factors should produce appropriate tempo descriptions."""
-        match = _make_sample_match()
-        target_va = VAPoint(valence=0.0, arousal=0.5)
+        match = self.default_match
+        target_va = self.default_va
 
         # Fast tempo
         desc_fast = generate_preview_description(
@@ -302,8 +382,8 @@ class TestGeneratePreviewDescription(unittest.TestCase):
 
     def test_zero_distance_gives_max_confidence(self) -> None:
         """A perfect VA match should give confidence ≈ 1.0."""
-        match = _make_sample_match(distance=0.0)
-        target_va = VAPoint(valence=0.3, arousal=0.75)
+        match = replace(self.default_match, distance=0.0)
+        target_va = _VA_REQUESTING
 
         desc = generate_preview_description(
             "Requesting", match, target_va
@@ -364,10 +444,12 @@ class TestGenerateDescriptionFromSynthesis(unittest.TestCase):
         """All known intents should work through the convenience wrapper."""
         match = _make_sample_match()
 
-        for intent in INTENT_VA_MAP:
+        valid_labels = frozenset(INTENT_CN_LABELS.values())
+
+        for intent in _INTENT_KEYS:
             desc = generate_description_from_synthesis(intent=intent, match=match)
             self.assertIsInstance(desc, PreviewDescription)
-            self.assertIn(desc.intent_label, INTENT_CN_LABELS.values())
+            self.assertIn(desc.intent_label, valid_labels)
 
 
 # ════════════════════════════════════════════════════════════════════════
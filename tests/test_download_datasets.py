@@ -16,18 +16,33 @@ e.g.  B_ANI01_MC_FN_SIM01_101.wav
 
 from __future__ import annotations
 
+import errno
+import functools
+import hashlib
+import io
 import json
+import os
 import shutil
 import subprocess
+import tarfile
 import tempfile
+import threading
 import unittest
 import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
+import numpy as np
+
 from tools.download_datasets import (
     CONTEXT_VA_PRESETS,
+    CATMEOWS_DOI,
     CATMEOWS_PATTERN,
+    GZIP_INDEX_SUFFIX,
+    HAS_RAPIDGZIP,
+    _parse_catmeows_stems,
+    _parse_catmeows_stems_parallel,
     brushing_va_for_individual,
     build_registry,
     collect_wav_files,
@@ -35,10 +50,66 @@ from tools.download_datasets import (
     ensure_directories,
     extract_archives,
     parse_catmeows_filename,
+    run_pipeline,
     save_registry,
 )
 
 
+# Keep file fixtures in RAM on Linux (tmpfs); fall back to the default tmp dir.
+_FIXTURE_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def _tmpdir() -> tempfile.TemporaryDirectory:
+    """Self-cleaning fixture directory under ``_FIXTURE_ROOT``."""
+    return tempfile.TemporaryDirectory(dir=_FIXTURE_ROOT, ignore_cleanup_errors=True)
+
+
+def _mkdtemp() -> str:
+    """Fixture directory under ``_FIXTURE_ROOT`` for setUp/tearDown pairs."""
+    return tempfile.mkdtemp(dir=_FIXTURE_ROOT)
+
+
+_CLEANUP_THREADS: list[threading.Thread] = []
+
+
+def _async_rmtree(path: str | Path) -> None:
+    """Move *path* aside and delete it on a background thread.
+
+    The rename is O(1), so teardown returns immediately; the unlinks overlap
+    with the next test. ``tearDownModule`` joins the outstanding threads.
+    """
+    trash = f"{path}.trash{os.urandom(4).hex()}"
+    try:
+        os.rename(path, trash)
+    except OSError:
+        trash = str(path)
+    thread = threading.Thread(
+        target=shutil.rmtree,
+        args=(trash,),
+        kwargs={"ignore_errors": True},
+        daemon=True,
+    )
+    thread.start()
+    _CLEANUP_THREADS.append(thread)
+
+
+def tearDownModule():
+    for thread in _CLEANUP_THREADS:
+        thread.join()
+    _CLEANUP_THREADS.clear()
+
+
+def _touch_many(directory: Path, names: list[str]) -> None:
+    """Create empty files with one open/close each (no stat as in Path.touch)."""
+    for name in names:
+        fd = os.open(
+            os.path.join(directory, name),
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+            0o644,
+        )
+        os.close(fd)
+
+
 class TestParseCatMeowsFilename(unittest.TestCase):
     """Validate CatMeows naming convention parser."""
 
@@ -159,6 +230,46 @@ class TestParseCatMeowsFilename(unittest.TestCase):
         self.assertEqual(result["sex"], "Male Intact")
 
 
+class TestParseCatMeowsStems(unittest.TestCase):
+    """Batch parser used by build_registry."""
+
+    def test_results_align_with_stems(self):
+        stems = [
+            "F_BAC01_MC_MN_SIM01_101",
+            "random_noise",
+            "I_BLE01_EU_FN_DEL01_1SEQ1",
+            "",
+            "F_BAC01_MC_MN_SIM01_101x",
+        ]
+        results = _parse_catmeows_stems(stems)
+        self.assertEqual(len(results), len(stems))
+        self.assertEqual(results[0]["cat_id"], "BAC01")
+        self.assertIsNone(results[1])
+        self.assertEqual(results[2]["recording"], "1SEQ1")
+        self.assertIsNone(results[3])
+        self.assertIsNone(results[4])
+
+    def test_matches_single_parser(self):
+        stems = ["B_ANI01_MC_FN_SIM01_101", "I_DAK01_MC_FN_SIM01_116", "meow"]
+        self.assertEqual(
+            _parse_catmeows_stems(stems),
+            [parse_catmeows_filename(s) for s in stems],
+        )
+
+    def test_empty(self):
+        self.assertEqual(_parse_catmeows_stems([]), [])
+
+    def test_parallel_matches_serial(self):
+        stems = [
+            "B_ANI01_MC_FN_SIM01_101", "junk", "I_DAK01_MC_FN_SIM01_116",
+            "F_BAC01_MC_MN_SIM01_101", "", "I_BLE01_EU_FN_DEL01_1SEQ1",
+        ]
+        with patch("tools.download_datasets.PARALLEL_PARSE_MIN_FILES", 1), \
+             patch("tools.download_datasets.PARSE_BLOCK_SIZE", 4):
+            parallel = _parse_catmeows_stems_parallel(stems)
+        self.assertEqual(parallel, _parse_catmeows_stems(stems))
+
+
 class TestBrushingVA(unittest.TestCase):
     """Dedicated tests for the brushing VA helper."""
 
@@ -168,12 +279,15 @@ class TestBrushingVA(unittest.TestCase):
             "IND01", "JJX01", "MAG01", "MAT01", "MIN01", "NIG01",
             "NUL01", "REG01", "SPI01", "TIG01", "WHO01",
         ]
-        for cid in cat_ids:
-            va = brushing_va_for_individual(cid)
-            self.assertGreaterEqual(va["valence"], -0.2)
-            self.assertLessEqual(va["valence"], 0.4)
-            self.assertGreaterEqual(va["arousal"], 0.3)
-            self.assertLessEqual(va["arousal"], 0.7)
+        vas = np.array([
+            [va["valence"], va["arousal"]]
+            for va in map(brushing_va_for_individual, cat_ids)
+        ])
+        valence, arousal = vas[:, 0], vas[:, 1]
+        bad_valence = np.flatnonzero((valence < -0.2) | (valence > 0.4))
+        bad_arousal = np.flatnonzero((arousal < 0.3) | (arousal > 0.7))
+        self.assertEqual(bad_valence.size, 0, [cat_ids[i] for i in bad_valence])
+        self.assertEqual(bad_arousal.size, 0, [cat_ids[i] for i in bad_arousal])
 
     def test_reproducibility(self):
         self.assertEqual(
@@ -194,7 +308,7 @@ class TestBrushingVA(unittest.TestCase):
 
 class TestEnsureDirectories(unittest.TestCase):
     def test_creates_directories(self):
-        with tempfile.TemporaryDirectory() as tmp:
+        with _tmpdir() as tmp:
             dirs = [Path(tmp) / "a" / "b", Path(tmp) / "c"]
             with patch("tools.download_datasets.CATMEOWS_DIR", dirs[0]), \
                  patch("tools.download_datasets.MEOWSIC_DIR", dirs[1]), \
@@ -205,7 +319,7 @@ class TestEnsureDirectories(unittest.TestCase):
 
     def test_idempotent(self):
         """Calling twice should not raise."""
-        with tempfile.TemporaryDirectory() as tmp:
+        with _tmpdir() as tmp:
             d = Path(tmp) / "x"
             with patch("tools.download_datasets.CATMEOWS_DIR", d), \
                  patch("tools.download_datasets.MEOWSIC_DIR", d), \
@@ -217,10 +331,10 @@ class TestEnsureDirectories(unittest.TestCase):
 
 class TestCollectWavFiles(unittest.TestCase):
     def setUp(self):
-        self.tmp = tempfile.mkdtemp()
+        self.tmp = _mkdtemp()
 
     def tearDown(self):
-        shutil.rmtree(self.tmp)
+        _async_rmtree(self.tmp)
 
     def test_finds_wav_recursively(self):
         base = Path(self.tmp)
@@ -232,7 +346,7 @@ class TestCollectWavFiles(unittest.TestCase):
 
         wavs = collect_wav_files(base)
         self.assertEqual(len(wavs), 2)
-        names = {w.name for w in wavs}
+        names = {os.path.basename(w) for w in wavs}
         self.assertIn("top.wav", names)
         self.assertIn("deep.wav", names)
 
@@ -245,10 +359,10 @@ class TestCollectWavFiles(unittest.TestCase):
 
 class TestExtractArchives(unittest.TestCase):
     def setUp(self):
-        self.tmp = Path(tempfile.mkdtemp())
+        self.tmp = Path(_mkdtemp())
 
     def tearDown(self):
-        shutil.rmtree(self.tmp)
+        _async_rmtree(self.tmp)
 
     def test_extract_zip(self):
         zip_path = self.tmp / "test_data.zip"
@@ -265,27 +379,113 @@ class TestExtractArchives(unittest.TestCase):
         count = extract_archives(self.tmp)
         self.assertEqual(count, 0)
 
+    def test_skip_truncated_zip(self):
+        """A valid signature with a broken body still falls back to BadZipFile."""
+        (self.tmp / "truncated.zip").write_bytes(b"PK\x03\x04" + b"\x00" * 16)
+        count = extract_archives(self.tmp)
+        self.assertEqual(count, 0)
+
+    def test_extract_tar_gz(self):
+        tar_path = Path(self.tmp) / "test.tar.gz"
+        with tarfile.open(tar_path, "w:gz") as tf:
+            for name in ("audio/a.wav", "audio/b.wav"):
+                info = tarfile.TarInfo(name)
+                info.size = 4
+                tf.addfile(info, io.BytesIO(b"RIFF"))
+
+        count = extract_archives(Path(self.tmp))
+        self.assertEqual(count, 1)
+        self.assertEqual((Path(self.tmp) / "audio" / "b.wav").read_bytes(), b"RIFF")
+
+    @unittest.skipUnless(HAS_RAPIDGZIP, "rapidgzip not installed")
+    def test_gzip_index_saved_and_reused(self):
+        tar_path = Path(self.tmp) / "test.tar.gz"
+        with tarfile.open(tar_path, "w:gz") as tf:
+            info = tarfile.TarInfo("audio/a.wav")
+            info.size = 4
+            tf.addfile(info, io.BytesIO(b"RIFF"))
+
+        self.assertEqual(extract_archives(Path(self.tmp)), 1)
+        index_path = tar_path.with_name(tar_path.name + GZIP_INDEX_SUFFIX)
+        self.assertTrue(index_path.is_file())
+
+        shutil.rmtree(Path(self.tmp) / "audio")
+        self.assertEqual(extract_archives(Path(self.tmp)), 1)
+        self.assertEqual((Path(self.tmp) / "audio" / "a.wav").read_bytes(), b"RIFF")
+
+    def test_skip_truncated_tar_gz(self):
+        tar_path = Path(self.tmp) / "test.tar.gz"
+        with tarfile.open(tar_path, "w:gz") as tf:
+            data = os.urandom(1 << 16)
+            info = tarfile.TarInfo("audio/a.wav")
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+        tar_path.write_bytes(tar_path.read_bytes()[: tar_path.stat().st_size // 2])
+
+        self.assertEqual(extract_archives(Path(self.tmp)), 0)
+
+    def _write_random_tar_gz(self) -> Path:
+        tar_path = Path(self.tmp) / "test.tar.gz"
+        with tarfile.open(tar_path, "w:gz") as tf:
+            data = os.urandom(1 << 18)
+            info = tarfile.TarInfo("audio/a.wav")
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+        return tar_path
+
+    def test_skip_corrupt_tar_gz(self):
+        tar_path = self._write_random_tar_gz()
+        raw = bytearray(tar_path.read_bytes())
+        middle = len(raw) // 2
+        raw[middle:middle + 64] = bytes(b ^ 0xFF for b in raw[middle:middle + 64])
+        tar_path.write_bytes(raw)
+
+        self.assertEqual(extract_archives(Path(self.tmp)), 0)
+
+    def test_io_error_during_extraction_propagates(self):
+        self._write_random_tar_gz()
+        disk_full = OSError(errno.ENOSPC, "No space left on device")
+        with patch.object(tarfile.TarFile, "extractall", side_effect=disk_full):
+            with self.assertRaises(OSError) as ctx:
+                extract_archives(Path(self.tmp))
+        self.assertEqual(ctx.exception.errno, errno.ENOSPC)
+
+    @unittest.skipUnless(HAS_RAPIDGZIP, "rapidgzip not installed")
+    def test_non_gzip_value_error_propagates(self):
+        # rapidgzip reports decode failures as ValueError; one raised while
+        # writing members must not be mistaken for a bad archive.
+        self._write_random_tar_gz()
+        with patch.object(
+            tarfile.TarFile, "extractall", side_effect=ValueError("bad member name")
+        ):
+            with self.assertRaisesRegex(ValueError, "bad member name"):
+                extract_archives(Path(self.tmp))
+
     def test_empty_directory(self):
         count = extract_archives(self.tmp)
         self.assertEqual(count, 0)
 
 
 class TestDownloadZenodoDataset(unittest.TestCase):
-    """Test the download wrapper with mocked subprocess."""
+    """Test the zenodo_get CLI path with mocked subprocess."""
 
     @patch("tools.download_datasets.subprocess.run")
     def test_success(self, mock_run: MagicMock):
         mock_run.return_value = MagicMock(returncode=0, stderr="")
-        with tempfile.TemporaryDirectory() as tmp:
-            ok = download_zenodo_dataset("10.5281/zenodo.0000000", Path(tmp))
+        with _tmpdir() as tmp:
+            ok = download_zenodo_dataset(
+                "10.5281/zenodo.0000000", Path(tmp), use_cli=True
+            )
         self.assertTrue(ok)
         mock_run.assert_called_once()
 
     @patch("tools.download_datasets.subprocess.run")
     def test_failure_nonzero_exit(self, mock_run: MagicMock):
         mock_run.return_value = MagicMock(returncode=1, stderr="error msg")
-        with tempfile.TemporaryDirectory() as tmp:
-            ok = download_zenodo_dataset("10.5281/zenodo.0000000", Path(tmp))
+        with _tmpdir() as tmp:
+            ok = download_zenodo_dataset(
+                "10.5281/zenodo.0000000", Path(tmp), use_cli=True
+            )
         self.assertFalse(ok)
 
     @patch(
@@ -293,8 +493,10 @@ class TestDownloadZenodoDataset(unittest.TestCase):
         side_effect=FileNotFoundError,
     )
     def test_zenodo_get_not_installed(self, _mock):
-        with tempfile.TemporaryDirectory() as tmp:
-            ok = download_zenodo_dataset("10.5281/zenodo.0000000", Path(tmp))
+        with _tmpdir() as tmp:
+            ok = download_zenodo_dataset(
+                "10.5281/zenodo.0000000", Path(tmp), use_cli=True
+            )
         self.assertFalse(ok)
 
     @patch(
@@ -302,54 +504,229 @@ class TestDownloadZenodoDataset(unittest.TestCase):
         side_effect=subprocess.TimeoutExpired(cmd="zenodo_get", timeout=10),
     )
     def test_timeout(self, _mock):
-        with tempfile.TemporaryDirectory() as tmp:
-            ok = download_zenodo_dataset("10.5281/zenodo.0000000", Path(tmp))
+        with _tmpdir() as tmp:
+            ok = download_zenodo_dataset(
+                "10.5281/zenodo.0000000", Path(tmp), use_cli=True
+            )
         self.assertFalse(ok)
 
 
+class TestDownloadZenodoHttp(unittest.TestCase):
+    """Test the direct REST API download path with a mocked transport."""
+
+    RECORD = {
+        "files": [
+            {
+                "key": "a.zip",
+                "links": {"self": "https://zenodo.org/api/records/1/files/a.zip/content"},
+            },
+            {
+                "key": "b.txt",
+                "links": {"self": "https://zenodo.org/api/records/1/files/b.txt/content"},
+            },
+        ]
+    }
+
+    def _client_factory(self, handler):
+        transport = httpx.MockTransport(handler)
+        return functools.partial(httpx.AsyncClient, transport=transport)
+
+    def test_downloads_all_files(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/records/1":
+                return httpx.Response(200, json=self.RECORD)
+            name = request.url.path.split("/")[-2]
+            return httpx.Response(200, content=name.encode() * 3)
+
+        with _tmpdir() as tmp, \
+             patch("tools.download_datasets.httpx.AsyncClient", self._client_factory(handler)):
+            ok = download_zenodo_dataset("10.5281/zenodo.1", Path(tmp))
+            self.assertTrue(ok)
+            self.assertEqual((Path(tmp) / "a.zip").read_bytes(), b"a.zipa.zipa.zip")
+            self.assertEqual((Path(tmp) / "b.txt").read_bytes(), b"b.txtb.txtb.txt")
+
+    def test_md5_checksum_verified(self):
+        record = {"files": [dict(self.RECORD["files"][0])]}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/records/1":
+                return httpx.Response(200, json=record)
+            return httpx.Response(200, content=b"payload")
+
+        good = "md5:" + hashlib.md5(b"payload").hexdigest()
+        for checksum, expect_ok in ((good, True), ("md5:" + "0" * 32, False)):
+            record["files"][0]["checksum"] = checksum
+            with self.subTest(checksum=checksum), _tmpdir() as tmp, \
+                 patch("tools.download_datasets.httpx.AsyncClient", self._client_factory(handler)):
+                ok = download_zenodo_dataset("10.5281/zenodo.1", Path(tmp))
+                self.assertEqual(ok, expect_ok)
+                # A corrupt download must not be left behind for extraction.
+                self.assertEqual((Path(tmp) / "a.zip").exists(), expect_ok)
+
+    def _single_file_record(self, payload: bytes) -> dict:
+        entry = dict(self.RECORD["files"][0])
+        entry["size"] = len(payload)
+        entry["checksum"] = "md5:" + hashlib.md5(payload).hexdigest()
+        return {"files": [entry]}
+
+    def test_complete_file_skipped(self):
+        payload = b"0123456789" * 10
+        record = self._single_file_record(payload)
+        file_requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/records/1":
+                return httpx.Response(200, json=record)
+            file_requests.append(request)
+            return httpx.Response(200, content=payload)
+
+        with _tmpdir() as tmp, \
+             patch("tools.download_datasets.httpx.AsyncClient", self._client_factory(handler)):
+            (Path(tmp) / "a.zip").write_bytes(payload)
+            self.assertTrue(download_zenodo_dataset("10.5281/zenodo.1", Path(tmp)))
+        self.assertEqual(file_requests, [])
+
+    def test_partial_or_corrupt_file_refetched(self):
+        payload = b"0123456789" * 10
+        record = self._single_file_record(payload)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/records/1":
+                return httpx.Response(200, json=record)
+            requested.append(request.headers.get("range"))
+            if requested[-1] is None:
+                return httpx.Response(200, content=payload)
+            start = int(requested[-1].removeprefix("bytes=").rstrip("-"))
+            return httpx.Response(206, content=payload[start:])
+
+        # Short copy resumes from its end; full-size corrupt copy restarts.
+        for local, expect_range in ((payload[:37], "bytes=37-"), (b"X" * 100, None)):
+            requested: list = []
+            with self.subTest(expect_range=expect_range), _tmpdir() as tmp, \
+                 patch("tools.download_datasets.httpx.AsyncClient", self._client_factory(handler)):
+                (Path(tmp) / "a.zip").write_bytes(local)
+                self.assertTrue(download_zenodo_dataset("10.5281/zenodo.1", Path(tmp)))
+                self.assertEqual((Path(tmp) / "a.zip").read_bytes(), payload)
+            self.assertEqual(requested, [expect_range])
+
+    def test_range_ignored_restarts(self):
+        payload = b"abcdefghij" * 10
+        record = self._single_file_record(payload)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/records/1":
+                return httpx.Response(200, json=record)
+            return httpx.Response(200, content=payload)
+
+        with _tmpdir() as tmp, \
+             patch("tools.download_datasets.httpx.AsyncClient", self._client_factory(handler)):
+            (Path(tmp) / "a.zip").write_bytes(payload[:50])
+            self.assertTrue(download_zenodo_dataset("10.5281/zenodo.1", Path(tmp)))
+            self.assertEqual((Path(tmp) / "a.zip").read_bytes(), payload)
+
+    def test_write_error_returns_false(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/api/records/1":
+                return httpx.Response(200, json=self.RECORD)
+            return httpx.Response(200, content=b"payload")
+
+        disk_full = OSError(errno.ENOSPC, "No space left on device")
+        with _tmpdir() as tmp, \
+             patch("tools.download_datasets.httpx.AsyncClient", self._client_factory(handler)), \
+             patch("tools.download_datasets.open", side_effect=disk_full, create=True):
+            ok = download_zenodo_dataset("10.5281/zenodo.1", Path(tmp))
+        self.assertFalse(ok)
+
+    def test_missing_record(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(404)
+
+        with _tmpdir() as tmp, \
+             patch("tools.download_datasets.httpx.AsyncClient", self._client_factory(handler)):
+            ok = download_zenodo_dataset("10.5281/zenodo.1", Path(tmp))
+        self.assertFalse(ok)
+
+
+class TestRunPipeline(unittest.TestCase):
+    """Download fan-out and failure reporting in run_pipeline."""
+
+    def setUp(self):
+        for target in ("ensure_directories", "extract_archives", "save_registry"):
+            self.enterContext(patch(f"tools.download_datasets.{target}"))
+        self.enterContext(
+            patch("tools.download_datasets.build_registry", return_value={})
+        )
+
+    def _run(self, outcomes: dict) -> tuple[bool, MagicMock]:
+        def download(doi, output_dir, *, use_cli=False):
+            outcome = outcomes[doi == CATMEOWS_DOI]
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return outcome
+
+        with patch(
+            "tools.download_datasets.download_zenodo_dataset", side_effect=download
+        ) as mock_download, patch("tools.download_datasets.logger") as mock_logger:
+            ok = run_pipeline()
+        self.assertEqual(mock_download.call_count, 2)
+        return ok, mock_logger
+
+    def test_one_download_raising_does_not_abort_the_other(self):
+        ok, mock_logger = self._run({True: OSError("disk full"), False: True})
+        self.assertTrue(ok)
+        errors = [c.args for c in mock_logger.error.call_args_list]
+        self.assertEqual(len(errors), 1)
+        self.assertIn(CATMEOWS_DOI, errors[0])
+
+    def test_both_downloads_failing_aborts(self):
+        ok, mock_logger = self._run({True: RuntimeError("boom"), False: False})
+        self.assertFalse(ok)
+        self.assertEqual(mock_logger.error.call_count, 2)
+
+
 class TestBuildRegistry(unittest.TestCase):
     """Build a registry from synthetic mock WAV files using real names."""
 
-    def setUp(self):
-        self.tmp = Path(tempfile.mkdtemp())
-        self.catmeows = self.tmp / "catmeows"
-        self.meowsic = self.tmp / "meowsic"
-        self.catmeows.mkdir()
-        self.meowsic.mkdir()
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = Path(_mkdtemp())
+        cls.addClassCleanup(_async_rmtree, cls.tmp)
+        cls.catmeows = cls.tmp / "catmeows"
+        cls.meowsic = cls.tmp / "meowsic"
+        cls.catmeows.mkdir()
+        cls.meowsic.mkdir()
 
         # Create mock CatMeows files (real naming convention)
-        self.catmeow_names = [
+        cls.catmeow_names = [
             "F_BAC01_MC_MN_SIM01_101.wav",       # Food
             "I_BLE01_EU_FN_DEL01_205.wav",        # Isolation
             "B_ANI01_MC_FN_SIM01_101.wav",        # Brushing rec 1
             "B_ANI01_MC_FN_SIM01_302.wav",        # Brushing rec 2 (same cat)
             "I_CAN01_EU_FN_GIA01_1SEQ1.wav",      # Isolation SEQ variant
         ]
-        for name in self.catmeow_names:
-            (self.catmeows / name).touch()
+        _touch_many(cls.catmeows, cls.catmeow_names)
 
         # Create mock Meowsic files
-        self.meowsic_names = ["meow_sample_01.wav", "purr_clip_02.wav"]
-        for name in self.meowsic_names:
-            (self.meowsic / name).touch()
+        cls.meowsic_names = ["meow_sample_01.wav", "purr_clip_02.wav"]
+        _touch_many(cls.meowsic, cls.meowsic_names)
 
-    def tearDown(self):
-        shutil.rmtree(self.tmp)
+        # One class-wide patcher instead of a decorator per test method.
+        # Stopped via addClassCleanup, which also runs if setUpClass raises.
+        patcher = patch("tools.download_datasets.ASSETS_DIR", cls.tmp)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
+        # Every test reads the same registry, so build it once.
+        cls.registry = build_registry(cls.catmeows, cls.meowsic)
 
-    @patch("tools.download_datasets.ASSETS_DIR")
-    def test_total_samples(self, mock_assets):
-        mock_assets.__class__ = Path
-        mock_assets.return_value = self.tmp
-        registry = build_registry(self.catmeows, self.meowsic)
+    def test_total_samples(self):
+        registry = self.registry
         self.assertEqual(registry["total_samples"], 7)
         self.assertEqual(registry["datasets"]["catmeows"]["total_samples"], 5)
         self.assertEqual(registry["datasets"]["meowsic"]["total_samples"], 2)
 
-    @patch("tools.download_datasets.ASSETS_DIR")
-    def test_catmeows_food_metadata(self, mock_assets):
-        mock_assets.__class__ = Path
-        mock_assets.return_value = self.tmp
-        registry = build_registry(self.catmeows, self.meowsic)
+    def test_catmeows_food_metadata(self):
+        registry = self.registry
         food = [
             s for s in registry["samples"]
             if s.get("context_code") == "F"
@@ -360,11 +737,8 @@ class TestBuildRegistry(unittest.TestCase):
         self.assertAlmostEqual(food[0]["valence"], 0.5)
         self.assertAlmostEqual(food[0]["arousal"], 0.9)
 
-    @patch("tools.download_datasets.ASSETS_DIR")
-    def test_isolation_va(self, mock_assets):
-        mock_assets.__class__ = Path
-        mock_assets.return_value = self.tmp
-        registry = build_registry(self.catmeows, self.meowsic)
+    def test_isolation_va(self):
+        registry = self.registry
         iso = [
             s for s in registry["samples"]
             if s.get("context_code") == "I"
@@ -374,11 +748,8 @@ class TestBuildRegistry(unittest.TestCase):
             self.assertAlmostEqual(entry["valence"], -0.8)
             self.assertAlmostEqual(entry["arousal"], 0.7)
 
-    @patch("tools.download_datasets.ASSETS_DIR")
-    def test_meowsic_defaults(self, mock_assets):
-        mock_assets.__class__ = Path
-        mock_assets.return_value = self.tmp
-        registry = build_registry(self.catmeows, self.meowsic)
+    def test_meowsic_defaults(self):
+        registry = self.registry
         meo = [s for s in registry["samples"] if s["dataset"] == "meowsic"]
         self.assertEqual(len(meo), 2)
         for entry in meo:
@@ -386,20 +757,34 @@ class TestBuildRegistry(unittest.TestCase):
             self.assertAlmostEqual(entry["valence"], 0.0)
             self.assertAlmostEqual(entry["arousal"], 0.5)
 
-    @patch("tools.download_datasets.ASSETS_DIR")
-    def test_registry_has_version(self, mock_assets):
-        mock_assets.__class__ = Path
-        mock_assets.return_value = self.tmp
-        registry = build_registry(self.catmeows, self.meowsic)
+    def test_file_path_relative_to_assets(self):
+        name = "B_ANI01_MC_FN_SIM01_101.wav"
+        with _tmpdir() as tmp:
+            root = Path(tmp)
+            nested = root / "raw_data" / "catmeows" / "dataset" / "dataset"
+            nested.mkdir(parents=True)
+            _touch_many(nested, [name])
+            with patch("tools.download_datasets.ASSETS_DIR", root):
+                registry = build_registry(
+                    root / "raw_data" / "catmeows", root / "raw_data" / "meowsic"
+                )
+
+        (sample,) = registry["samples"]
+        self.assertEqual(
+            sample["file_path"],
+            os.path.join("raw_data", "catmeows", "dataset", "dataset", name),
+        )
+        self.assertEqual(sample["filename"], name)
+        self.assertEqual(sample["id"], name[:-4])
+
+    def test_registry_has_version(self):
+        registry = self.registry
         self.assertEqual(registry["version"], "1.0")
         self.assertIn("generated_at", registry)
 
-    @patch("tools.download_datasets.ASSETS_DIR")
-    def test_brushing_same_cat_same_va(self, mock_assets):
+    def test_brushing_same_cat_same_va(self):
         """Two recordings from the same cat should share VA values."""
-        mock_assets.__class__ = Path
-        mock_assets.return_value = self.tmp
-        registry = build_registry(self.catmeows, self.meowsic)
+        registry = self.registry
         brushing = [
             s for s in registry["samples"]
             if s.get("context_code") == "B"
@@ -408,12 +793,9 @@ class TestBuildRegistry(unittest.TestCase):
         self.assertEqual(brushing[0]["valence"], brushing[1]["valence"])
         self.assertEqual(brushing[0]["arousal"], brushing[1]["arousal"])
 
-    @patch("tools.download_datasets.ASSETS_DIR")
-    def test_seq_variant_parsed(self, mock_assets):
+    def test_seq_variant_parsed(self):
         """SEQ-variant filenames should still be parsed correctly."""
-        mock_assets.__class__ = Path
-        mock_assets.return_value = self.tmp
-        registry = build_registry(self.catmeows, self.meowsic)
+        registry = self.registry
         seq = [
             s for s in registry["samples"]
             if s.get("recording") == "1SEQ1"
@@ -424,7 +806,7 @@ class TestBuildRegistry(unittest.TestCase):
 
 class TestSaveRegistry(unittest.TestCase):
     def test_writes_valid_json(self):
-        with tempfile.TemporaryDirectory() as tmp:
+        with _tmpdir() as tmp:
             out = Path(tmp) / "sub" / "registry.json"
             registry = {
                 "version": "1.0",
@@ -440,7 +822,7 @@ class TestSaveRegistry(unittest.TestCase):
             self.assertEqual(loaded["samples"][0]["id"], "test")
 
     def test_creates_parent_dirs(self):
-        with tempfile.TemporaryDirectory() as tmp:
+        with _tmpdir() as tmp:
             out = Path(tmp) / "a" / "b" / "c" / "reg.json"
             save_registry({"version": "1.0", "total_samples": 0, "samples": []}, out)
             self.assertTrue(out.exists())
@@ -479,6 +861,17 @@ class TestCatMeowsPatternRegex(unittest.TestCase):
         """Pure numeric cat_id (no alpha prefix) should not match."""
         self.assertIsNone(CATMEOWS_PATTERN.match("F_123_MC_FN_SIM01_101"))
 
+    def test_embedded_newline_does_not_match(self):
+        """The public pattern is anchored to the whole name, not to lines."""
+        name = "junk\nF_BAC01_MC_MN_SIM01_101"
+        self.assertIsNone(CATMEOWS_PATTERN.match(name))
+        self.assertIsNone(parse_catmeows_filename(name + ".wav"))
+        parsed = _parse_catmeows_stems(
+            [name, "F_BAC01_MC_MN_SIM01_101\nx", "B_ANI01_MC_FN_SIM01_101"]
+        )
+        self.assertEqual(parsed[:2], [None, None])
+        self.assertEqual(parsed[2]["cat_id"], "ANI01")
+
 
 if __name__ == "__main__":
     unittest.main()
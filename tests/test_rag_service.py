@@ -10,41 +10,42 @@ sys.modules["chromadb.utils"] = MagicMock()
 sys.modules["chromadb.utils.embedding_functions"] = MagicMock()
 
 import unittest
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 # Now we can safely import the service, as vector_store import of chromadb will use the mock
 from app.services.rag_service import initialize_knowledge_base, retrieve_context
 
+
+def _fake_collection(count=0, query_result=None):
+    """Lightweight collection stand-in; only add/query record calls."""
+    return SimpleNamespace(
+        count=lambda: count,
+        add=Mock(),
+        query=Mock(return_value=query_result),
+    )
+
 class TestRAGService(unittest.TestCase):
 
     @patch("app.services.rag_service.get_collection")
     def test_initialize_knowledge_base(self, mock_get_collection):
-        # Mock collection
-        mock_collection = MagicMock()
-        mock_get_collection.return_value = mock_collection
-        
         # Test Case 1: Collection is empty, should initialize
-        mock_collection.count.return_value = 0
+        mock_collection = _fake_collection(count=0)
+        mock_get_collection.return_value = mock_collection
         initialize_knowledge_base()
         mock_collection.add.assert_called_once()
         print("✅ RAG Initialization (empty db) passed.")
 
-        # Reset mock
-        mock_collection.reset_mock()
-
         # Test Case 2: Collection is not empty, should skip
-        mock_collection.count.return_value = 10
+        mock_collection = _fake_collection(count=10)
+        mock_get_collection.return_value = mock_collection
         initialize_knowledge_base()
         mock_collection.add.assert_not_called()
         print("✅ RAG Initialization (existing db) passed.")
 
     @patch("app.services.rag_service.get_collection")
     def test_retrieve_context(self, mock_get_collection):
-        # Mock collection
-        mock_collection = MagicMock()
-        mock_get_collection.return_value = mock_collection
-        
-        # Mock query results
-        mock_collection.query.return_value = {
+        # Mock collection with canned query results
+        mock_collection = _fake_collection(query_result={
             'ids': [['doc1', 'doc2']],
             'distances': [[0.1, 0.2]],
             'metadatas': [[None, None]],
@@ -52,7 +53,8 @@ class TestRAGService(unittest.TestCase):
             'documents': [['First relevant doc.', 'Second relevant doc.']],
             'uris': None,
             'data': None
-        }
+        })
+        mock_get_collection.return_value = mock_collection
 
         # Test retrieval
         context = retrieve_context("test query", n_results=2)
@@ -13,9 +13,12 @@ Covers:
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import functools
 import io
 import json
+import struct
 import sys
 import tempfile
 import unittest
@@ -65,14 +68,23 @@ def _make_llm_result(**overrides) -> CatTranslationResponse:
     return CatTranslationResponse(**defaults)
 
 
+def _wav_sr(wav_bytes: bytes) -> int:
+    """Sample rate from a canonical RIFF/WAVE header (fmt chunk, offset 24)."""
+    return struct.unpack_from("<I", wav_bytes, 24)[0]
+
+
+@functools.lru_cache(maxsize=32)
 def _make_sine_audio(
     freq: float = 440.0,
     duration: float = 0.3,
     sr: int = 22050,
 ) -> tuple[np.ndarray, int]:
-    """Generate a short sine wave for testing."""
-    t = np.linspace(0, duration, int(sr * duration), endpoint=False)
-    y = (0.8 * np.sin(2.0 * np.pi * freq * t)).astype(np.float32)
+    """Generate a short sine wave for testing (cached, read-only)."""
+    y = np.arange(int(sr * duration), dtype=np.float32)
+    y *= np.float32(2.0 * np.pi * freq / sr)
+    np.sin(y, out=y)
+    y *= np.float32(0.8)
+    y.setflags(write=False)
     return y, sr
 
 
@@ -113,12 +125,8 @@ class TestEmotionToIntent(unittest.TestCase):
         """All emotion categories should map to valid DSP intents."""
         from src.engine.dsp_processor import INTENT_VA_MAP
 
-        for emotion, intent in EMOTION_TO_INTENT.items():
-            self.assertIn(
-                intent,
-                INTENT_VA_MAP,
-                f"Emotion '{emotion}' maps to unknown intent '{intent}'",
-            )
+        missing = set(EMOTION_TO_INTENT.values()) - INTENT_VA_MAP.keys()
+        self.assertFalse(missing, f"Emotions map to unknown intents: {missing}")
 
 
 # ════════════════════════════════════════════════════════════════════════
@@ -147,30 +155,21 @@ class TestEncodeAudioBase64(unittest.TestCase):
         audio, sr = _make_sine_audio(sr=22050)
         encoded = _encode_audio_base64(audio, sr, target_sr=16000)
 
-        wav_bytes = base64.b64decode(encoded)
-        buf = io.BytesIO(wav_bytes)
-        _, decoded_sr = sf.read(buf)
-        self.assertEqual(decoded_sr, 16000)
+        self.assertEqual(_wav_sr(base64.b64decode(encoded)), 16000)
 
     def test_resampling_to_44100(self) -> None:
         """Should support 44.1kHz output."""
         audio, sr = _make_sine_audio(sr=22050)
         encoded = _encode_audio_base64(audio, sr, target_sr=44100)
 
-        wav_bytes = base64.b64decode(encoded)
-        buf = io.BytesIO(wav_bytes)
-        _, decoded_sr = sf.read(buf)
-        self.assertEqual(decoded_sr, 44100)
+        self.assertEqual(_wav_sr(base64.b64decode(encoded)), 44100)
 
     def test_invalid_sr_falls_back(self) -> None:
         """Invalid sample rate should fall back to default."""
         audio, sr = _make_sine_audio(sr=16000)
         encoded = _encode_audio_base64(audio, sr, target_sr=48000)
 
-        wav_bytes = base64.b64decode(encoded)
-        buf = io.BytesIO(wav_bytes)
-        _, decoded_sr = sf.read(buf)
-        self.assertEqual(decoded_sr, DEFAULT_OUTPUT_SR)
+        self.assertEqual(_wav_sr(base64.b64decode(encoded)), DEFAULT_OUTPUT_SR)
 
     def test_output_is_valid_base64(self) -> None:
         """The output should be valid base64."""
@@ -222,26 +221,41 @@ class TestPreviewToSchema(unittest.TestCase):
 class TestSynthesizeAndDescribe(unittest.IsolatedAsyncioTestCase):
     """Tests for the full synthesize_and_describe pipeline."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Real assets tree holding the default match's WAV, so the service's
+        # ``ASSETS_DIR / file_path`` existence check runs on actual Paths.
+        cls._tmpdir = tempfile.TemporaryDirectory()
+        cls.assets_dir = Path(cls._tmpdir.name)
+        wav_path = cls.assets_dir / _make_mock_sample_match().file_path
+        wav_path.parent.mkdir(parents=True)
+        audio, sr = _make_sine_audio(sr=22050)
+        sf.write(str(wav_path), audio, sr)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmpdir.cleanup()
+
+    def setUp(self) -> None:
+        # One set of DSP patches per test; defaults describe the happy path
+        # and individual tests only tweak what they need.
+        self.mock_get = self.enterContext(
+            patch("app.services.synthesis_service.get_best_match")
+        )
+        self.mock_transform = self.enterContext(
+            patch("app.services.synthesis_service.apply_prosody_transform")
+        )
+        self.enterContext(
+            patch("app.services.synthesis_service.ASSETS_DIR", self.assets_dir)
+        )
+        self.mock_get.return_value = [_make_mock_sample_match()]
+        self.mock_transform.return_value = _make_sine_audio(sr=22050)
+
     async def test_successful_synthesis(self) -> None:
         """Full pipeline with mocked DSP engine should succeed."""
         llm_result = _make_llm_result(emotion_category="Hungry")
-        mock_audio, mock_sr = _make_sine_audio(sr=22050)
-        mock_match = _make_mock_sample_match()
 
-        with (
-            patch("app.services.synthesis_service.get_best_match") as mock_get_match,
-            patch("app.services.synthesis_service.apply_prosody_transform") as mock_transform,
-            patch("app.services.synthesis_service.ASSETS_DIR") as mock_assets,
-        ):
-            mock_get_match.return_value = [mock_match]
-            mock_transform.return_value = (mock_audio, mock_sr)
-
-            # Mock the file existence check
-            mock_wav_path = MagicMock()
-            mock_wav_path.exists.return_value = True
-            mock_assets.__truediv__ = MagicMock(return_value=mock_wav_path)
-
-            result = await synthesize_and_describe(llm_result, breed="Maine Coon")
+        result = await synthesize_and_describe(llm_result, breed="Maine Coon")
 
         self.assertIsInstance(result, MeowSynthesisResponse)
         self.assertTrue(result.synthesis_ok)
@@ -260,11 +274,9 @@ class TestSynthesizeAndDescribe(unittest.IsolatedAsyncioTestCase):
     async def test_no_matching_samples(self) -> None:
         """Should degrade gracefully when no samples match."""
         llm_result = _make_llm_result()
+        self.mock_get.return_value = []
 
-        with patch("app.services.synthesis_service.get_best_match") as mock_get:
-            mock_get.return_value = []
-
-            result = await synthesize_and_describe(llm_result)
+        result = await synthesize_and_describe(llm_result)
 
         self.assertFalse(result.synthesis_ok)
         self.assertIsNone(result.audio_base64)
@@ -274,86 +286,45 @@ class TestSynthesizeAndDescribe(unittest.IsolatedAsyncioTestCase):
     async def test_missing_audio_file(self) -> None:
         """Should degrade gracefully when the audio file doesn't exist."""
         llm_result = _make_llm_result()
-        mock_match = _make_mock_sample_match()
+        self.mock_get.return_value = [
+            _make_mock_sample_match(file_path="test/missing.wav")
+        ]
 
-        with (
-            patch("app.services.synthesis_service.get_best_match") as mock_get,
-            patch("app.services.synthesis_service.ASSETS_DIR") as mock_assets,
-        ):
-            mock_get.return_value = [mock_match]
-            mock_wav_path = MagicMock()
-            mock_wav_path.exists.return_value = False
-            mock_assets.__truediv__ = MagicMock(return_value=mock_wav_path)
-
-            result = await synthesize_and_describe(llm_result)
+        result = await synthesize_and_describe(llm_result)
 
         self.assertFalse(result.synthesis_ok)
 
     async def test_dsp_exception_caught(self) -> None:
         """DSP exceptions should be caught, not propagated."""
         llm_result = _make_llm_result()
+        self.mock_transform.side_effect = RuntimeError("PSOLA failed")
 
-        with (
-            patch("app.services.synthesis_service.get_best_match") as mock_get,
-            patch("app.services.synthesis_service.ASSETS_DIR") as mock_assets,
-            patch("app.services.synthesis_service.apply_prosody_transform") as mock_transform,
-        ):
-            mock_match = _make_mock_sample_match()
-            mock_get.return_value = [mock_match]
-            mock_wav_path = MagicMock()
-            mock_wav_path.exists.return_value = True
-            mock_assets.__truediv__ = MagicMock(return_value=mock_wav_path)
-            mock_transform.side_effect = RuntimeError("PSOLA failed")
-
-            result = await synthesize_and_describe(llm_result)
+        result = await synthesize_and_describe(llm_result)
 
         self.assertFalse(result.synthesis_ok)
         self.assertEqual(result.human_interpretation, "I'm hungry!")
 
     async def test_different_emotions(self) -> None:
         """All emotion categories should produce valid responses."""
-        mock_audio, mock_sr = _make_sine_audio()
-        mock_match = _make_mock_sample_match()
-
-        for emotion in ["Hungry", "Angry", "Happy", "Alert"]:
-            llm_result = _make_llm_result(emotion_category=emotion)
+        self.mock_transform.return_value = _make_sine_audio()
 
-            with (
-                patch("app.services.synthesis_service.get_best_match") as mock_get,
-                patch("app.services.synthesis_service.apply_prosody_transform") as mock_t,
-                patch("app.services.synthesis_service.ASSETS_DIR") as mock_a,
-            ):
-                mock_get.return_value = [mock_match]
-                mock_t.return_value = (mock_audio, mock_sr)
-                mock_path = MagicMock()
-                mock_path.exists.return_value = True
-                mock_a.__truediv__ = MagicMock(return_value=mock_path)
-
-                result = await synthesize_and_describe(llm_result)
+        emotions = ["Hungry", "Angry", "Happy", "Alert"]
+        results = await asyncio.gather(*(
+            synthesize_and_describe(_make_llm_result(emotion_category=emotion))
+            for emotion in emotions
+        ))
 
+        for emotion, result in zip(emotions, results):
             self.assertTrue(result.synthesis_ok, f"Failed for emotion: {emotion}")
             self.assertEqual(result.emotion_category, emotion)
 
     async def test_custom_output_sr(self) -> None:
         """Should respect the output_sr parameter."""
         llm_result = _make_llm_result()
-        mock_audio, mock_sr = _make_sine_audio(sr=22050)
-        mock_match = _make_mock_sample_match()
-
-        with (
-            patch("app.services.synthesis_service.get_best_match") as mock_get,
-            patch("app.services.synthesis_service.apply_prosody_transform") as mock_t,
-            patch("app.services.synthesis_service.ASSETS_DIR") as mock_a,
-        ):
-            mock_get.return_value = [mock_match]
-            mock_t.return_value = (mock_audio, mock_sr)
-            mock_path = MagicMock()
-            mock_path.exists.return_value = True
-            mock_a.__truediv__ = MagicMock(return_value=mock_path)
-
-            result = await synthesize_and_describe(
-                llm_result, output_sr=44100
-            )
+
+        result = await synthesize_and_describe(
+            llm_result, output_sr=44100
+        )
 
         self.assertTrue(result.synthesis_ok)
         self.assertEqual(result.synthesis_metadata.sample_rate, 44100)
@@ -0,0 +1,104 @@
+"""
+Unit tests for the Flet client's WebSocket streaming (translation_client).
+
+A fake websocket stands in for the /ws/translate endpoint: it records what
+the client sends and answers the ``stop`` message with a ``result`` event.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import unittest
+from typing import Any
+from unittest.mock import patch
+
+from src.flet_mobile.translation_client import _MAX_FRAME_BYTES, TranslationClient
+
+
+class _FakeWebSocket:
+    """Minimal stand-in for a ``websockets`` client connection."""
+
+    def __init__(self, first_send_delay: float = 0.0) -> None:
+        self.sent: list[Any] = []
+        self._events: asyncio.Queue[str] = asyncio.Queue()
+        self._first_send_delay = first_send_delay
+
+    async def __aenter__(self) -> "_FakeWebSocket":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+    async def send(self, message: Any) -> None:
+        if isinstance(message, bytes) and self._first_send_delay:
+            # Simulate a stalled uplink on the first audio frame.
+            delay, self._first_send_delay = self._first_send_delay, 0.0
+            await asyncio.sleep(delay)
+        self.sent.append(message)
+        if isinstance(message, str) and json.loads(message).get("type") == "stop":
+            await self._events.put(json.dumps({"type": "result", "ok": True}))
+
+    async def recv(self) -> str:
+        return await self._events.get()
+
+    @property
+    def audio(self) -> list[bytes]:
+        return [m for m in self.sent if isinstance(m, bytes)]
+
+
+async def _chunks(parts: list[bytes], fail_after: int | None = None):
+    for index, part in enumerate(parts):
+        if fail_after is not None and index == fail_after:
+            raise RuntimeError("mic died")
+        yield part
+        await asyncio.sleep(0)
+
+
+class TestStreamTranslate(unittest.IsolatedAsyncioTestCase):
+    """stream_translate send/receive coordination over a fake socket."""
+
+    async def _stream(self, ws: _FakeWebSocket, chunks: Any) -> list[dict[str, Any]]:
+        events: list[dict[str, Any]] = []
+
+        async def on_event(payload: dict[str, Any]) -> None:
+            events.append(payload)
+
+        with patch(
+            "src.flet_mobile.translation_client.websockets.connect",
+            return_value=ws,
+        ):
+            await asyncio.wait_for(
+                TranslationClient().stream_translate(chunks, on_event), timeout=2.0
+            )
+        return events
+
+    async def test_chunks_then_stop_then_result(self):
+        ws = _FakeWebSocket()
+        parts = [bytes([i]) * 320 for i in range(5)]
+        events = await self._stream(ws, _chunks(parts))
+
+        self.assertEqual(json.loads(ws.sent[0])["type"], "config")
+        self.assertEqual(json.loads(ws.sent[-1]), {"type": "stop"})
+        self.assertEqual(b"".join(ws.audio), b"".join(parts))
+        self.assertEqual(events, [{"type": "result", "ok": True}])
+
+    async def test_chunk_iterator_error_propagates(self):
+        ws = _FakeWebSocket()
+        parts = [b"\x00" * 320] * 5
+        with self.assertRaisesRegex(RuntimeError, "mic died"):
+            await self._stream(ws, _chunks(parts, fail_after=2))
+        self.assertNotIn(json.dumps({"type": "stop"}), ws.sent)
+
+    async def test_coalesced_frames_are_capped(self):
+        ws = _FakeWebSocket(first_send_delay=0.05)
+        parts = [bytes([i % 256]) * 320 for i in range(60)]
+        await self._stream(ws, _chunks(parts))
+
+        self.assertEqual(b"".join(ws.audio), b"".join(parts))
+        self.assertGreater(max(map(len, ws.audio)), 320)   # coalescing happened
+        self.assertLess(max(map(len, ws.audio)), _MAX_FRAME_BYTES + 320)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,13 +9,18 @@ Usage::
 
     python -m tools.build_tags                # full run with acoustic features
     python -m tools.build_tags --skip-audio   # metadata tags only (no librosa)
+    python -m tools.build_tags --accurate     # pYIN instead of YIN for f0
+    python -m tools.build_tags --no-f0        # duration/energy only (no decode)
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -23,6 +28,23 @@ from typing import Any
 import numpy as np
 from loguru import logger
 
+# ── Optional: librosa/soundfile (only needed for acoustic features) ──
+try:
+    import librosa
+    import soundfile as sf
+
+    HAS_LIBROSA = True
+except ImportError:
+    HAS_LIBROSA = False
+
+# ── Optional: orjson for fast output serialisation ───────────────────
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Project root
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 ASSETS_DIR = PROJECT_ROOT / "assets"
@@ -33,34 +55,97 @@ OUTPUT_PATH = ASSETS_DIR / "audio_db" / "tagged_samples.json"
 sys.path.insert(0, str(PROJECT_ROOT))
 from app.data.meow_catalog import tag_acoustic, tag_sample_metadata  # noqa: E402
 
+# Files handed to each feature-extraction worker per round trip.
+EXTRACT_CHUNK_SIZE = 8
+
+# rms_percentile labels indexed by bucket (0 = below P25, 2 = above P75).
+_RMS_BUCKET_LABELS = ("low", "mid", "high")
+
+# Frames per block when streaming RMS in the --no-f0 pass.
+RMS_BLOCK_SIZE = 65536
+
+# f0 search range (Hz) shared by the YIN and pYIN estimators.
+F0_FMIN = 60
+F0_FMAX = 1500
+
+
+def extract_energy_features(wav_path: str | Path) -> dict[str, Any]:
+    """Duration and RMS energy only, without decoding the whole file.
+
+    Duration comes from the header; RMS is accumulated block by block
+    over the mono mixdown.  f0 keys are returned as ``None`` so
+    ``tag_acoustic()`` simply emits no pitch tags.
+    """
+    try:
+        with sf.SoundFile(str(wav_path)) as f:
+            frames, sr = f.frames, f.samplerate
+            sum_sq = 0.0
+            for block in f.blocks(blocksize=RMS_BLOCK_SIZE, dtype="float32"):
+                if block.ndim == 2:
+                    block = block.mean(axis=1, dtype=np.float32)
+                sum_sq += float(np.dot(block, block))
+    except Exception as e:
+        logger.warning("Failed to load {}: {}", os.path.basename(wav_path), e)
+        return {}
+
+    return {
+        "median_f0": None,
+        "duration": float(frames / sr) if sr > 0 else 0.0,
+        "rms_energy": float(np.sqrt(sum_sq / frames)) if frames > 0 else 0.0,
+        "f0_slope": None,
+        "f0_std": None,
+    }
+
 
-def extract_acoustic_features(wav_path: Path) -> dict[str, Any]:
+def extract_acoustic_features(
+    wav_path: str | Path, *, accurate: bool = False
+) -> dict[str, Any]:
     """Extract acoustic features from a WAV file using librosa.
 
+    Decoding goes through soundfile directly (native rate, float32,
+    channels averaged to mono); librosa is only used for f0.  Runs in
+    ``build()``'s worker processes, so it takes a plain path string.
+
+    f0 comes from ``librosa.yin`` (plain autocorrelation, frames outside
+    the search range are treated as unvoiced); ``accurate=True`` uses the
+    slower HMM-smoothed ``librosa.pyin`` instead.
+
     Returns a dict with keys expected by ``tag_acoustic()``:
         - median_f0, duration, rms_energy, f0_slope, f0_std, rms_percentile
     """
-    import librosa
-
     try:
-        y, sr = librosa.load(str(wav_path), sr=None, mono=True)
+        y, sr = sf.read(str(wav_path), dtype="float32", always_2d=False)
     except Exception as e:
-        logger.warning("Failed to load {}: {}", wav_path.name, e)
+        logger.warning("Failed to load {}: {}", os.path.basename(wav_path), e)
         return {}
+    if y.ndim == 2:
+        y = y.mean(axis=1, dtype=np.float32)
 
     duration = float(len(y) / sr) if sr > 0 else 0.0
 
     # RMS energy
     rms = np.sqrt(np.mean(y ** 2))
 
-    # F0 via pYIN
-    f0, voiced_flag, _ = librosa.pyin(
-        y,
-        fmin=60,
-        fmax=1500,
-        sr=sr,
-    )
-    voiced_f0 = f0[voiced_flag] if f0 is not None else np.array([])
+    if accurate:
+        # F0 via pYIN
+        f0, voiced_flag, _ = librosa.pyin(
+            y,
+            fmin=F0_FMIN,
+            fmax=F0_FMAX,
+            sr=sr,
+        )
+        voiced_f0 = f0[voiced_flag] if f0 is not None else np.array([])
+    else:
+        # F0 via YIN; YIN clips to [fmin, fmax], so boundary hits = unvoiced
+        f0 = librosa.yin(
+            y,
+            fmin=F0_FMIN,
+            fmax=F0_FMAX,
+            sr=sr,
+            frame_length=2048,
+            hop_length=512,
+        )
+        voiced_f0 = f0[(f0 > F0_FMIN) & (f0 < F0_FMAX) & np.isfinite(f0)]
 
     median_f0: float | None = None
     f0_slope: float | None = None
@@ -69,11 +154,12 @@ def extract_acoustic_features(wav_path: Path) -> dict[str, Any]:
     if len(voiced_f0) > 0:
         median_f0 = float(np.median(voiced_f0))
         f0_std = float(np.std(voiced_f0))
-        # Slope: linear regression of f0 over time
-        if len(voiced_f0) > 1:
-            x = np.arange(len(voiced_f0), dtype=np.float64)
-            coeffs = np.polyfit(x, voiced_f0, 1)
-            f0_slope = float(coeffs[0])  # Hz per frame
+        # Slope: closed-form least-squares fit of f0 over frame index;
+        # for x = 0..n-1, sum((x - x̄)²) = n(n² - 1)/12.
+        n = len(voiced_f0)
+        if n > 1:
+            xc = np.arange(n, dtype=np.float64) - (n - 1) / 2.0
+            f0_slope = float(xc @ voiced_f0 / (n * (n * n - 1) / 12.0))  # Hz per frame
         else:
             f0_slope = 0.0
 
@@ -86,37 +172,64 @@ def extract_acoustic_features(wav_path: Path) -> dict[str, Any]:
     }
 
 
+def _init_feature_worker() -> None:
+    """Pool initializer: warm librosa's lazy submodules before the first task."""
+    librosa.yin(
+        np.zeros(4096, dtype=np.float32), fmin=F0_FMIN, fmax=F0_FMAX, sr=22050
+    )
+
+
 def compute_rms_percentiles(
     samples_with_features: list[dict[str, Any]],
+    rms: np.ndarray | None = None,
 ) -> None:
-    """Compute global RMS percentiles and set ``rms_percentile`` in place."""
-    rms_values = [
-        s["_features"]["rms_energy"]
-        for s in samples_with_features
-        if s.get("_features", {}).get("rms_energy") is not None
-    ]
-    if not rms_values:
+    """Compute global RMS percentiles and set ``rms_percentile`` in place.
+
+    *rms* is an optional float array aligned with *samples_with_features*
+    (NaN where a sample has no RMS); it is gathered from ``_features``
+    when omitted.  Samples strictly above P75 are ``high``, strictly below
+    P25 ``low``, everything else (including missing RMS) ``mid``.
+    """
+    if rms is None:
+        rms = np.fromiter(
+            (
+                np.nan if (v := s.get("_features", {}).get("rms_energy")) is None else v
+                for s in samples_with_features
+            ),
+            dtype=np.float64,
+            count=len(samples_with_features),
+        )
+    finite = rms[np.isfinite(rms)]
+    if finite.size == 0:
         return
 
-    arr = np.array(rms_values)
-    p25 = float(np.percentile(arr, 25))
-    p75 = float(np.percentile(arr, 75))
-
-    for s in samples_with_features:
-        feat = s.get("_features", {})
-        rms = feat.get("rms_energy")
-        if rms is None:
-            feat["rms_percentile"] = "mid"
-        elif rms > p75:
-            feat["rms_percentile"] = "high"
-        elif rms < p25:
-            feat["rms_percentile"] = "low"
-        else:
-            feat["rms_percentile"] = "mid"
+    p25, p75 = np.percentile(finite, [25, 75])
+    # 0 = low, 1 = mid, 2 = high; NaN compares False and stays mid.
+    buckets = np.ones(rms.shape, dtype=np.int8)
+    buckets[rms < p25] = 0
+    buckets[rms > p75] = 2
+
+    for s, b in zip(samples_with_features, buckets.tolist()):
+        s.setdefault("_features", {})["rms_percentile"] = _RMS_BUCKET_LABELS[b]
+
 
+def _dumps_indented(obj: Any) -> str:
+    """Serialise *obj* as indent-2 JSON text (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def build(
+    skip_audio: bool = False, accurate: bool = False, with_f0: bool = True
+) -> None:
+    """Main build pipeline.
 
-def build(skip_audio: bool = False) -> None:
-    """Main build pipeline."""
+    *accurate* selects pYIN over YIN for f0 extraction; ``with_f0=False``
+    skips f0 entirely and only streams duration and RMS energy.
+    """
     logger.info("Loading registry from {}", REGISTRY_PATH)
 
     with open(REGISTRY_PATH, "r", encoding="utf-8") as f:
@@ -127,69 +240,96 @@ def build(skip_audio: bool = False) -> None:
 
     # ── Phase 1: Extract acoustic features (optional) ────────────────
     if not skip_audio:
+        if not HAS_LIBROSA:
+            raise ImportError(
+                "librosa and soundfile are required for acoustic features; "
+                "install them or pass --skip-audio"
+            )
         logger.info("Extracting acoustic features (this may take a while)...")
-        for i, sample in enumerate(samples):
+        # RMS lives in one array aligned with ``samples`` (NaN = none).
+        rms = np.full(len(samples), np.nan, dtype=np.float64)
+        pending: list[int] = []
+        paths: list[str] = []
+        for idx, sample in enumerate(samples):
             wav_path = ASSETS_DIR / sample["file_path"]
             if wav_path.exists():
-                features = extract_acoustic_features(wav_path)
-                sample["_features"] = features
+                pending.append(idx)
+                paths.append(str(wav_path))
             else:
                 logger.debug("WAV not found: {}", wav_path)
                 sample["_features"] = {}
 
-            if (i + 1) % 50 == 0:
-                logger.info("  Processed {}/{} samples", i + 1, len(samples))
+        # Each WAV is independent: decode + f0 in a process pool.  Only the
+        # f0 path uses librosa, so only it warms librosa in each worker.
+        if with_f0:
+            extract = functools.partial(extract_acoustic_features, accurate=accurate)
+            initializer = _init_feature_worker
+        else:
+            extract = extract_energy_features
+            initializer = None
+        with ProcessPoolExecutor(initializer=initializer) as executor:
+            results = executor.map(extract, paths, chunksize=EXTRACT_CHUNK_SIZE)
+            for i, (idx, features) in enumerate(zip(pending, results)):
+                samples[idx]["_features"] = features
+                if features.get("rms_energy") is not None:
+                    rms[idx] = features["rms_energy"]
+                if (i + 1) % 50 == 0:
+                    logger.info("  Processed {}/{} samples", i + 1, len(pending))
 
         # Compute global RMS percentiles
-        compute_rms_percentiles(samples)
+        compute_rms_percentiles(samples, rms)
     else:
         logger.info("Skipping audio feature extraction (--skip-audio)")
         for sample in samples:
             sample["_features"] = {}
 
-    # ── Phase 2: Apply all tags ──────────────────────────────────────
-    tagged_samples: list[dict[str, Any]] = []
-
-    for sample in samples:
-        # Metadata-based tags (dimensions 1, 2, 4, 5)
-        tags = tag_sample_metadata(sample)
-
-        # Acoustic tags (dimension 3)
-        features = sample.get("_features", {})
-        tags["acoustic"] = tag_acoustic(features)
-
-        # Build output entry
-        entry = {
-            "id": sample["id"],
-            "file_path": sample["file_path"],
-            "breed": sample.get("breed", "Unknown"),
-            "valence": sample.get("valence", 0.0),
-            "arousal": sample.get("arousal", 0.0),
-            "context": sample.get("context", "Unknown"),
-            "tags": tags,
-        }
-        tagged_samples.append(entry)
-
-    # ── Phase 3: Write output ────────────────────────────────────────
-    output = {
+    # ── Phase 2 + 3: Tag each sample and stream it to disk ──────────
+    # Entries are written as they are produced (and each sample's
+    # ``_features`` dropped once tagged) instead of building the whole
+    # output document in memory first.  With orjson the file is
+    # byte-for-byte what a single dump of that document produced; the
+    # json fallback gives the same structure and indent-2 layout but may
+    # differ in float formatting and ends with a trailing newline.
+    header = {
         "version": "1.0",
         "generated_at": datetime.now(timezone.utc).isoformat(),
-        "total_samples": len(tagged_samples),
+        "total_samples": len(samples),
         "skip_audio": skip_audio,
-        "samples": tagged_samples,
     }
+    total_tags = 0
 
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
     with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
-
-    logger.success("Wrote {} tagged samples to {}", len(tagged_samples), OUTPUT_PATH)
+        # Reopen the header object and start the samples array.
+        f.write(_dumps_indented(header)[:-2])
+        f.write(',\n  "samples": [')
+        for i, sample in enumerate(samples):
+            # Metadata-based tags (dimensions 1, 2, 4, 5)
+            tags = tag_sample_metadata(sample)
+
+            # Acoustic tags (dimension 3)
+            features = sample.pop("_features", {})
+            tags["acoustic"] = tag_acoustic(features)
+            total_tags += sum(len(v) for v in tags.values())
+
+            # Build output entry
+            entry = {
+                "id": sample["id"],
+                "file_path": sample["file_path"],
+                "breed": sample.get("breed", "Unknown"),
+                "valence": sample.get("valence", 0.0),
+                "arousal": sample.get("arousal", 0.0),
+                "context": sample.get("context", "Unknown"),
+                "tags": tags,
+            }
+            f.write(",\n    " if i else "\n    ")
+            f.write(_dumps_indented(entry).replace("\n", "\n    "))
+        f.write("\n  ]\n}\n" if samples else "]\n}\n")
+
+    logger.success("Wrote {} tagged samples to {}", len(samples), OUTPUT_PATH)
 
     # Quick stats
-    total_tags = sum(
-        sum(len(v) for v in s["tags"].values()) for s in tagged_samples
-    )
-    logger.info("Total tags assigned: {} (avg {:.1f} per sample)", total_tags, total_tags / len(tagged_samples) if tagged_samples else 0)
+    logger.info("Total tags assigned: {} (avg {:.1f} per sample)", total_tags, total_tags / len(samples) if samples else 0)
 
 
 if __name__ == "__main__":
@@ -199,5 +339,15 @@ if __name__ == "__main__":
         action="store_true",
         help="Skip acoustic feature extraction (metadata tags only).",
     )
+    parser.add_argument(
+        "--accurate",
+        action="store_true",
+        help="Use pYIN instead of YIN for f0 (slower; for regression checks).",
+    )
+    parser.add_argument(
+        "--no-f0",
+        action="store_true",
+        help="Skip f0 estimation; only duration and RMS energy (no pitch tags).",
+    )
     args = parser.parse_args()
-    build(skip_audio=args.skip_audio)
+    build(skip_audio=args.skip_audio, accurate=args.accurate, with_f0=not args.no_f0)
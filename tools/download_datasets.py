@@ -9,22 +9,67 @@ Usage::
 
     python -m tools.download_datasets            # full pipeline
     python -m tools.download_datasets --skip-download  # index only
+    python -m tools.download_datasets --use-zenodo-get # download via CLI
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
+import functools
+import gzip
+import hashlib
 import json
+import os
 import re
 import subprocess
+import sys
 import tarfile
 import zipfile
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Iterator, Optional
 
+import httpx
 from loguru import logger
 
+# ── Optional: rapidgzip for parallel (multi-threaded) gzip inflation ─
+try:
+    import rapidgzip
+
+    HAS_RAPIDGZIP = True
+except ImportError:
+    HAS_RAPIDGZIP = False
+
+# ── Optional: python-isal for faster (ISA-L) gzip inflation ──────────
+try:
+    from isal import igzip, igzip_lib
+
+    HAS_ISAL = True
+except ImportError:
+    HAS_ISAL = False
+
+# ── Optional: h2 so httpx can multiplex downloads over HTTP/2 ────────
+try:
+    import h2  # noqa: F401
+
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+# ── Optional: orjson for fast registry serialisation ─────────────────
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # ──────────────────────────────── paths ─────────────────────────────────
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 ASSETS_DIR = PROJECT_ROOT / "assets"
@@ -40,6 +85,12 @@ REGISTRY_PATH = AUDIO_DB_DIR / "registry.json"
 CATMEOWS_DOI = "10.5281/zenodo.4007940"
 MEOWSIC_DOI = "10.5281/zenodo.3245999"
 
+# ──────────────────────────── Zenodo HTTP ───────────────────────────────
+ZENODO_RECORD_API = "https://zenodo.org/api/records/{record_id}"
+DOWNLOAD_CONCURRENCY = 8
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_TIMEOUT = httpx.Timeout(60.0)
+
 # ───────────────────── Valence / Arousal presets ────────────────────────
 #   Food     → positive anticipation, high arousal
 #   Isolation → negative distress, moderately high arousal
@@ -82,6 +133,28 @@ CATMEOWS_PATTERN = re.compile(
     r"(?P<name>[A-Za-z]+\d+)_"
     r"(?P<recording>\d+(?:SEQ\d+)?)$"
 )
+# Multiline copy used only to scan many newline-joined stems at once.
+_CATMEOWS_LINE_PATTERN = re.compile(CATMEOWS_PATTERN.pattern, re.MULTILINE)
+
+# Local-file header, empty-archive end record, spanned-archive marker.
+ZIP_SIGNATURES: tuple[bytes, ...] = (b"PK\x03\x04", b"PK\x05\x06", b"PK\x07\x08")
+# rapidgzip seek-point index saved beside a tarball: "<archive>.gzindex".
+GZIP_INDEX_SUFFIX = ".gzindex"
+# How the active inflater reports a corrupt or non-gzip archive. Only reads
+# from the inflater are translated to tarfile.ReadError (see _InflaterReader),
+# so errors raised while writing members are never mistaken for bad archives.
+# rapidgzip signals decode failures with plain ValueError / RuntimeError.
+if HAS_RAPIDGZIP:
+    _GZIP_DECODE_ERRORS: tuple[type[Exception], ...] = (ValueError, RuntimeError)
+elif HAS_ISAL:
+    _GZIP_DECODE_ERRORS = (gzip.BadGzipFile, igzip_lib.IsalError, EOFError)
+else:
+    _GZIP_DECODE_ERRORS = ()    # tarfile's own r|gz stream raises ReadError
+
+# ───────────── parallel parsing thresholds ──────────────────────────────
+# Below this many CatMeows files the pool start-up costs more than it saves.
+PARALLEL_PARSE_MIN_FILES = 1024
+PARSE_BLOCK_SIZE = 256
 
 # ════════════════════════════════════════════════════════════════════════
 #  Helper utilities
@@ -101,15 +174,25 @@ def brushing_va_for_individual(cat_id: str) -> dict[str, float]:
     Uses a stable hash so values look "random" yet are reproducible
     for the same ``cat_id`` string (e.g. ``"ANI01"``).
     """
+    valence, arousal = _brushing_va_cached(cat_id)
+    return {"valence": valence, "arousal": arousal}
+
+
+@functools.lru_cache(maxsize=512)
+def _brushing_va_cached(cat_id: str) -> tuple[float, float]:
+    """Memoised (valence, arousal) derivation behind the public helper.
+
+    Returns an immutable tuple so cached values cannot be mutated by callers.
+    """
     # deterministic hash: sum of ord values × Knuth constant
     KNUTH_CONST = 2654435761
     raw = sum(ord(c) for c in cat_id)
     hashed = (raw * KNUTH_CONST) % (2**32)
     t = (hashed % 1000) / 1000.0          # normalise → [0, 1)
-    return {
-        "valence": round(-0.2 + t * 0.6, 2),   # range −0.20 … +0.40
-        "arousal": round(0.3 + t * 0.4, 2),     # range  0.30 …  0.70
-    }
+    return (
+        round(-0.2 + t * 0.6, 2),   # valence range −0.20 … +0.40
+        round(0.3 + t * 0.4, 2),    # arousal range  0.30 …  0.70
+    )
 
 
 # ════════════════════════════════════════════════════════════════════════
@@ -117,14 +200,38 @@ def brushing_va_for_individual(cat_id: str) -> dict[str, float]:
 # ════════════════════════════════════════════════════════════════════════
 
 
-def download_zenodo_dataset(doi: str, output_dir: Path) -> bool:
-    """Download a Zenodo record via ``zenodo_get``.
+def download_zenodo_dataset(
+    doi: str,
+    output_dir: Path,
+    *,
+    use_cli: bool = False,
+) -> bool:
+    """Download every file of a Zenodo record.
+
+    By default the record is fetched directly from the Zenodo REST API with
+    concurrent streaming downloads. ``use_cli=True`` shells out to
+    ``zenodo_get`` instead.
 
     Returns ``True`` on success, ``False`` otherwise.
     """
     logger.info("⬇  Downloading DOI {} → {}", doi, output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    if use_cli:
+        return _download_with_zenodo_get(doi, output_dir)
+
+    try:
+        count = asyncio.run(_download_record(doi, output_dir))
+    except (httpx.HTTPError, KeyError, ValueError, OSError) as exc:
+        # OSError: disk full / permission denied while writing a file.
+        logger.error("Zenodo download failed for DOI {}: {}", doi, exc)
+        return False
+    logger.success("Download complete for DOI {} ({} file(s))", doi, count)
+    return True
+
+
+def _download_with_zenodo_get(doi: str, output_dir: Path) -> bool:
+    """Download a Zenodo record via the ``zenodo_get`` CLI."""
     try:
         result = subprocess.run(
             ["zenodo_get", "-d", doi, "-o", str(output_dir)],
@@ -148,11 +255,155 @@ def download_zenodo_dataset(doi: str, output_dir: Path) -> bool:
         return False
 
 
+async def _download_record(doi: str, output_dir: Path) -> int:
+    """Fetch a record's file list and download all files concurrently."""
+    record_id = doi.rsplit(".", 1)[-1]    # "10.5281/zenodo.4007940" → "4007940"
+    limits = httpx.Limits(max_connections=DOWNLOAD_CONCURRENCY)
+    async with httpx.AsyncClient(
+        http2=HAS_H2,               # one multiplexed connection when h2 is present
+        timeout=DOWNLOAD_TIMEOUT,
+        limits=limits,
+        follow_redirects=True,
+    ) as client:
+        response = await client.get(ZENODO_RECORD_API.format(record_id=record_id))
+        response.raise_for_status()
+        files = response.json()["files"]
+        await asyncio.gather(
+            *(_download_file(client, file_info, output_dir) for file_info in files)
+        )
+    return len(files)
+
+
+async def _download_file(
+    client: httpx.AsyncClient,
+    file_info: dict[str, Any],
+    output_dir: Path,
+) -> None:
+    """Stream one Zenodo file entry to disk in ``DOWNLOAD_CHUNK_SIZE`` chunks.
+
+    A local copy of the advertised size (and checksum) is kept as-is; a
+    shorter one is resumed with an HTTP ``Range`` request.  When the entry
+    carries an ``md5:`` checksum the payload is verified and a mismatching
+    file is removed (``ValueError``).
+    """
+    name = Path(file_info.get("key") or file_info["filename"]).name
+    links = file_info["links"]
+    url = links.get("self") or links["download"]
+    dest = output_dir / name
+    size = file_info.get("size", file_info.get("filesize"))
+
+    # Zenodo publishes "md5:<hex>"; hash while streaming so no second read.
+    algo, _, expected = (file_info.get("checksum") or "").partition(":")
+    digest = hashlib.md5() if algo == "md5" and expected else None
+
+    # Resume only when the record states the size and the local copy fits.
+    offset = dest.stat().st_size if dest.exists() else 0
+    if size is None or offset > size:
+        offset = 0
+    if offset:
+        if digest is not None:
+            digest = await asyncio.to_thread(_file_md5, dest)
+        if offset == size:
+            if digest is None or digest.hexdigest() == expected.lower():
+                logger.info("✓  {} already downloaded, skipping", name)
+                return
+            offset = 0
+            digest = hashlib.md5()
+
+    headers = {"Range": f"bytes={offset}-"} if offset else None
+    if offset:
+        logger.info("⬇  {} → {} (resuming at byte {})", name, dest, offset)
+    else:
+        logger.info("⬇  {} → {}", name, dest)
+    async with client.stream("GET", url, headers=headers) as response:
+        response.raise_for_status()
+        if offset and response.status_code != 206:
+            # Range ignored: the body is the whole file, start over.
+            offset = 0
+            if digest is not None:
+                digest = hashlib.md5()
+        with open(dest, "ab" if offset else "wb") as fh:
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                fh.write(chunk)
+                if digest is not None:
+                    digest.update(chunk)
+
+    if digest is not None and digest.hexdigest() != expected.lower():
+        dest.unlink(missing_ok=True)
+        raise ValueError(f"MD5 mismatch for {name}")
+
+
+def _file_md5(path: Path) -> Any:
+    """MD5 hash object over the current contents of *path*."""
+    with open(path, "rb") as fh:
+        return hashlib.file_digest(fh, "md5")
+
+
 # ════════════════════════════════════════════════════════════════════════
 #  Archive extraction
 # ════════════════════════════════════════════════════════════════════════
 
 
+class _InflaterReader:
+    """Read-only view of an inflater that reports decode errors as ``ReadError``.
+
+    tarfile's stream mode (``r|``) only ever calls ``read``.
+    """
+
+    __slots__ = ("_read",)
+
+    def __init__(self, fileobj: Any) -> None:
+        self._read = fileobj.read
+
+    def read(self, size: int = -1) -> bytes:
+        try:
+            return self._read(size)
+        except _GZIP_DECODE_ERRORS as exc:
+            raise tarfile.ReadError(f"corrupt gzip stream: {exc}") from exc
+
+
+@contextlib.contextmanager
+def _open_tar_stream(archive: Path) -> Iterator[tarfile.TarFile]:
+    """Open a gzipped tarball for a single sequential (non-seeking) pass.
+
+    Members are inflated and written in one forward stream.  The inflater
+    is rapidgzip (parallel, all cores) when installed, else ISA-L's
+    ``igzip``, else zlib.  rapidgzip's seek-point index is saved next to
+    the archive (``GZIP_INDEX_SUFFIX``) and reused on later runs so the
+    block-finder pass is skipped.
+    """
+    if HAS_RAPIDGZIP:
+        index_path = archive.with_name(archive.name + GZIP_INDEX_SUFFIX)
+        reuse_index = (
+            index_path.exists()
+            and index_path.stat().st_mtime >= archive.stat().st_mtime
+        )
+        workers = os.cpu_count() or 1
+        try:
+            gz_file = rapidgzip.open(str(archive), parallelization=workers)
+        except _GZIP_DECODE_ERRORS as exc:
+            raise tarfile.ReadError(f"corrupt gzip stream: {exc}") from exc
+        with gz_file as gz:
+            if reuse_index:
+                gz.import_index(str(index_path))
+            with tarfile.open(fileobj=_InflaterReader(gz), mode="r|") as tf:
+                yield tf
+            if not reuse_index:
+                try:
+                    gz.export_index(str(index_path))
+                except OSError as exc:
+                    logger.debug(
+                        "Could not save gzip index {}: {}", index_path, exc
+                    )
+    elif HAS_ISAL:
+        with igzip.open(archive, "rb") as gz, \
+             tarfile.open(fileobj=_InflaterReader(gz), mode="r|") as tf:
+            yield tf
+    else:
+        with tarfile.open(archive, mode="r|gz") as tf:
+            yield tf
+
+
 def extract_archives(target_dir: Path) -> int:
     """Extract all ``.zip`` and ``.tar.gz`` archives found in *target_dir*.
 
@@ -162,6 +413,11 @@ def extract_archives(target_dir: Path) -> int:
 
     for archive in sorted(target_dir.iterdir()):
         if archive.suffix == ".zip":
+            # Reject non-ZIP payloads by signature, without raising BadZipFile.
+            with open(archive, "rb") as fh:
+                if fh.read(4) not in ZIP_SIGNATURES:
+                    logger.warning("Bad ZIP — skipping {}", archive.name)
+                    continue
             logger.info("Extracting ZIP: {}", archive.name)
             try:
                 with zipfile.ZipFile(archive, "r") as zf:
@@ -173,7 +429,7 @@ def extract_archives(target_dir: Path) -> int:
         elif archive.name.endswith(".tar.gz") or archive.name.endswith(".tgz"):
             logger.info("Extracting TAR: {}", archive.name)
             try:
-                with tarfile.open(archive, "r:gz") as tf:
+                with _open_tar_stream(archive) as tf:
                     tf.extractall(target_dir)
                 extracted += 1
             except tarfile.TarError:
@@ -188,12 +444,31 @@ def extract_archives(target_dir: Path) -> int:
 # ════════════════════════════════════════════════════════════════════════
 
 
-def collect_wav_files(source_dir: Path) -> list[Path]:
-    """Recursively gather all ``.wav`` files under *source_dir*."""
+def collect_wav_files(source_dir: Path) -> list[str]:
+    """Recursively gather all ``.wav`` files under *source_dir*.
+
+    Returns sorted full paths as plain strings; callers lift to ``Path``
+    only where they need it.
+    """
     if not source_dir.exists():
         logger.warning("Source directory does not exist: {}", source_dir)
         return []
-    wavs = sorted(source_dir.rglob("*.wav"))
+    # Iterative os.scandir walk: DirEntry type checks reuse readdir data
+    # instead of issuing a stat per entry like Path.rglob.
+    found: list[str] = []
+    stack = [str(source_dir)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".wav"):
+                    found.append(entry.path)
+    wavs = sorted(found)
     logger.info("Found {} .wav file(s) in {}", len(wavs), source_dir)
     return wavs
 
@@ -217,41 +492,200 @@ def parse_catmeows_filename(filename: str) -> Optional[dict[str, Any]]:
 
     Returns ``None`` when the filename does not match the pattern.
     """
-    stem = Path(filename).stem
-    match = CATMEOWS_PATTERN.match(stem)
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    parsed = _parse_catmeows_stem(stem)
+    return dict(parsed) if parsed is not None else None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_catmeows_stem(stem: str) -> Optional[Mapping[str, Any]]:
+    """Memoised stem parser; returns a read-only view so cache entries stay intact."""
+    # Cheap "C_" prefix check rejects most non-CatMeows names before the regex.
+    if len(stem) < 2 or stem[1] != "_" or stem[0] not in CONTEXT_LABELS:
+        match = None
+    else:
+        match = CATMEOWS_PATTERN.match(stem)
     if not match:
-        logger.debug("No CatMeows match for '{}'", filename)
+        logger.debug("No CatMeows match for '{}'", stem)
         return None
+    return MappingProxyType(_catmeows_metadata(match))
+
+
+def _parse_catmeows_stems(stems: list[str]) -> list[Optional[dict[str, Any]]]:
+    """Parse many CatMeows stems with one regex scan.
 
-    g = match.groupdict()
-    ctx = g["context"]
+    The stems are joined into a newline-separated buffer and scanned with
+    ``finditer``; each match starts at a line start, which maps it back to
+    its stem. Stems that themselves contain a newline would straddle lines,
+    so they go through the single-name parser instead. Entries that do not
+    match stay ``None``.
+    """
+    results: list[Optional[dict[str, Any]]] = [None] * len(stems)
+    index_by_start: dict[int, int] = {}
+    joined: list[str] = []
+    offset = 0
+    for index, stem in enumerate(stems):
+        if "\n" in stem:
+            parsed = _parse_catmeows_stem(stem)
+            results[index] = dict(parsed) if parsed is not None else None
+            continue
+        index_by_start[offset] = index
+        joined.append(stem)
+        offset += len(stem) + 1
+    for match in _CATMEOWS_LINE_PATTERN.finditer("\n".join(joined)):
+        results[index_by_start[match.start()]] = _catmeows_metadata(match)
+    return results
+
+
+def _parse_catmeows_stems_parallel(stems: list[str]) -> list[Optional[dict[str, Any]]]:
+    """Parse stems across worker processes for large corpora.
+
+    Small inputs are parsed in-process. Larger ones are split into
+    ``PARSE_BLOCK_SIZE`` blocks, each parsed with one regex scan in a worker.
+    """
+    if len(stems) < PARALLEL_PARSE_MIN_FILES:
+        return _parse_catmeows_stems(stems)
+    blocks = [
+        stems[start:start + PARSE_BLOCK_SIZE]
+        for start in range(0, len(stems), PARSE_BLOCK_SIZE)
+    ]
+    with ProcessPoolExecutor() as executor:
+        return [
+            parsed
+            for block in executor.map(_parse_catmeows_stems, blocks)
+            for parsed in block
+        ]
+
+
+def _catmeows_metadata(
+    match: Any,
+    *,
+    _va_presets: Mapping[str, dict[str, float]] = CONTEXT_VA_PRESETS,
+    _contexts: Mapping[str, str] = CONTEXT_LABELS,
+    _breeds: Mapping[str, str] = BREED_LABELS,
+    _sexes: Mapping[str, str] = SEX_LABELS,
+    _brushing_va: Any = _brushing_va_cached,
+    _intern: Any = sys.intern,
+) -> dict[str, Any]:
+    """Map a successful ``CATMEOWS_PATTERN`` match to registry metadata.
+
+    The keyword-only defaults bind the label tables at definition time so
+    the per-file path uses local rather than global lookups. Per-cat fields
+    repeat across every recording of a cat, so they are interned.
+    """
+    ctx, cat_id, breed, sex, name, recording = match.groups()
+    cat_id, breed, sex, name = (
+        _intern(cat_id), _intern(breed), _intern(sex), _intern(name)
+    )
 
     # Valence / Arousal assignment
     if ctx == "B":
-        va = brushing_va_for_individual(g["cat_id"])
+        valence, arousal = _brushing_va(cat_id)
     else:
-        va = CONTEXT_VA_PRESETS[ctx]
+        va = _va_presets[ctx]
+        valence, arousal = va["valence"], va["arousal"]
 
     return {
         "context_code": ctx,
-        "context": CONTEXT_LABELS.get(ctx, "Unknown"),
-        "cat_id": g["cat_id"],
-        "breed_code": g["breed"],
-        "breed": BREED_LABELS.get(g["breed"], g["breed"]),
-        "sex_code": g["sex"],
-        "sex": SEX_LABELS.get(g["sex"], g["sex"]),
-        "cat_name": g["name"],
-        "recording": g["recording"],
-        "valence": va["valence"],
-        "arousal": va["arousal"],
+        "context": _contexts.get(ctx, "Unknown"),
+        "cat_id": cat_id,
+        "breed_code": breed,
+        "breed": _breeds.get(breed, breed),
+        "sex_code": sex,
+        "sex": _sexes.get(sex, sex),
+        "cat_name": name,
+        "recording": recording,
+        "valence": valence,
+        "arousal": arousal,
     }
 
 
+# Cat identifiers present in the CatMeows corpus; used to warm caches.
+_KNOWN_CATMEOWS_CAT_IDS: tuple[str, ...] = (
+    "ANI01", "BAC01", "BRA01", "BRI01", "CAN01", "DAK01",
+    "IND01", "JJX01", "MAG01", "MAT01", "MIN01", "NIG01",
+    "NUL01", "REG01", "SPI01", "TIG01", "WHO01",
+)
+
+
+def _warm_caches() -> None:
+    """Exercise the filename regex and prime the brushing-VA cache.
+
+    Moves one-off costs into import so the first parse is not an outlier.
+    Set ``MEOWSFORMER_WARM=0`` to skip.
+    """
+    CATMEOWS_PATTERN.match("F_BAC01_MC_MN_SIM01_101")
+    for cat_id in _KNOWN_CATMEOWS_CAT_IDS:
+        _brushing_va_cached(cat_id)
+
+
+if os.environ.get("MEOWSFORMER_WARM", "1") == "1":
+    _warm_caches()
+
+
 # ════════════════════════════════════════════════════════════════════════
 #  Registry builder
 # ════════════════════════════════════════════════════════════════════════
 
 
+@dataclass(slots=True)
+class RegistrySample:
+    """Compact per-WAV record used while the registry is being assembled.
+
+    Field order matches the JSON key order of a registry entry; fields left
+    as ``None`` are omitted by :meth:`to_dict`.
+    """
+
+    id: str
+    dataset: str
+    file_path: str
+    filename: str
+    context_code: Optional[str] = None
+    context: str = "Unknown"
+    cat_id: Optional[str] = None
+    breed_code: Optional[str] = None
+    breed: Optional[str] = None
+    sex_code: Optional[str] = None
+    sex: Optional[str] = None
+    cat_name: Optional[str] = None
+    recording: Optional[str] = None
+    valence: float = 0.0
+    arousal: float = 0.5
+
+    def to_dict(self) -> dict[str, Any]:
+        """Materialise the JSON registry entry."""
+        entry: dict[str, Any] = {}
+        for name in _REGISTRY_SAMPLE_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                entry[name] = value
+        return entry
+
+
+_REGISTRY_SAMPLE_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(RegistrySample))
+
+
+def _split_wav_path(path: str) -> tuple[str, str]:
+    """Return ``(stem, name)`` for *path* without building a ``Path``."""
+    name = os.path.basename(path)
+    return os.path.splitext(name)[0], name
+
+
+def _make_sample(
+    wav: str, dataset: str, assets_prefix: str, **extra: Any
+) -> RegistrySample:
+    """Build one registry record for *wav*.
+
+    *assets_prefix* is ``ASSETS_DIR`` with a trailing separator; paths under
+    it are stored relative to it by slicing, others are kept as-is.
+    """
+    stem, name = _split_wav_path(wav)
+    rel = wav[len(assets_prefix):] if wav.startswith(assets_prefix) else wav
+    return RegistrySample(
+        id=stem, dataset=dataset, file_path=rel, filename=name, **extra
+    )
+
+
 def build_registry(
     catmeows_dir: Path,
     meowsic_dir: Path,
@@ -268,45 +702,26 @@ def build_registry(
             "samples": [ ... ]
         }
     """
-    samples: list[dict[str, Any]] = []
+    assets_prefix = os.path.join(str(ASSETS_DIR), "")
 
     # ── CatMeows ──────────────────────────────────────────────────────
     catmeow_wavs = collect_wav_files(catmeows_dir)
-    for wav in catmeow_wavs:
-        try:
-            rel = wav.relative_to(ASSETS_DIR)
-        except ValueError:
-            rel = wav
-        entry: dict[str, Any] = {
-            "id": wav.stem,
-            "dataset": "catmeows",
-            "file_path": str(rel),
-            "filename": wav.name,
-        }
-        parsed = parse_catmeows_filename(wav.name)
-        if parsed:
-            entry.update(parsed)
-        else:
-            entry.update({"context": "Unknown", "valence": 0.0, "arousal": 0.5})
-        samples.append(entry)
+    catmeow_parsed = _parse_catmeows_stems_parallel(
+        [_split_wav_path(wav)[0] for wav in catmeow_wavs]
+    )
+    records = [
+        _make_sample(wav, "catmeows", assets_prefix, **(parsed or {}))
+        for wav, parsed in zip(catmeow_wavs, catmeow_parsed)
+    ]
 
     # ── Meowsic ───────────────────────────────────────────────────────
     meowsic_wavs = collect_wav_files(meowsic_dir)
-    for wav in meowsic_wavs:
-        try:
-            rel = wav.relative_to(ASSETS_DIR)
-        except ValueError:
-            rel = wav
-        entry = {
-            "id": wav.stem,
-            "dataset": "meowsic",
-            "file_path": str(rel),
-            "filename": wav.name,
-            "context": "Meowsic",
-            "valence": 0.0,
-            "arousal": 0.5,
-        }
-        samples.append(entry)
+    records.extend(
+        _make_sample(wav, "meowsic", assets_prefix, context="Meowsic")
+        for wav in meowsic_wavs
+    )
+
+    samples = [record.to_dict() for record in records]
 
     registry: dict[str, Any] = {
         "version": "1.0",
@@ -337,8 +752,18 @@ def build_registry(
 def save_registry(registry: dict[str, Any], output_path: Path) -> None:
     """Persist the registry dict to a JSON file."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as fh:
-        json.dump(registry, fh, indent=2, ensure_ascii=False)
+    if HAS_ORJSON:
+        output_path.write_bytes(
+            orjson.dumps(
+                registry,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_APPEND_NEWLINE
+                | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        )
+    else:
+        with open(output_path, "w", encoding="utf-8") as fh:
+            json.dump(registry, fh, indent=2, ensure_ascii=False)
     logger.success(
         "Registry saved → {} ({} samples)",
         output_path,
@@ -351,14 +776,16 @@ def save_registry(registry: dict[str, Any], output_path: Path) -> None:
 # ════════════════════════════════════════════════════════════════════════
 
 
-def run_pipeline(*, skip_download: bool = False) -> bool:
+def run_pipeline(*, skip_download: bool = False, use_cli: bool = False) -> bool:
     """Execute the full data-acquisition pipeline.
 
     Parameters
     ----------
     skip_download : bool
-        When ``True`` skip the ``zenodo_get`` step and only
+        When ``True`` skip the download step and only
         (re-)build the metadata index from existing files.
+    use_cli : bool
+        Download through the ``zenodo_get`` CLI instead of the REST API.
     """
     logger.info("=== Meowsformer Data Acquisition Pipeline ===")
 
@@ -367,15 +794,34 @@ def run_pipeline(*, skip_download: bool = False) -> bool:
 
     # 2. Download (optional)
     if not skip_download:
-        cat_ok = download_zenodo_dataset(CATMEOWS_DOI, CATMEOWS_DIR)
-        meo_ok = download_zenodo_dataset(MEOWSIC_DOI, MEOWSIC_DIR)
+        # The two records are independent; fetch them side by side.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                doi: executor.submit(
+                    download_zenodo_dataset, doi, target, use_cli=use_cli
+                )
+                for doi, target in (
+                    (CATMEOWS_DOI, CATMEOWS_DIR),
+                    (MEOWSIC_DOI, MEOWSIC_DIR),
+                )
+            }
+        # Collect each record's outcome on its own so one failure cannot
+        # hide the other's result.
+        downloaded: dict[str, bool] = {}
+        for doi, future in futures.items():
+            try:
+                downloaded[doi] = future.result()
+            except Exception as exc:
+                logger.error("Download of DOI {} raised: {!r}", doi, exc)
+                downloaded[doi] = False
+        cat_ok, meo_ok = downloaded[CATMEOWS_DOI], downloaded[MEOWSIC_DOI]
         if not (cat_ok or meo_ok):
             logger.error("Both downloads failed — aborting.")
             return False
 
-        # 3. Extract
-        extract_archives(CATMEOWS_DIR)
-        extract_archives(MEOWSIC_DIR)
+        # 3. Extract (zlib inflation releases the GIL, so threads overlap)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(extract_archives, (CATMEOWS_DIR, MEOWSIC_DIR)))
     else:
         logger.info("--skip-download active; working with existing files")
 
@@ -400,8 +846,16 @@ def main() -> None:
         action="store_true",
         help="Skip Zenodo download; only rebuild the metadata index",
     )
+    parser.add_argument(
+        "--use-zenodo-get",
+        action="store_true",
+        help="Download via the zenodo_get CLI instead of the Zenodo REST API",
+    )
     args = parser.parse_args()
-    success = run_pipeline(skip_download=args.skip_download)
+    success = run_pipeline(
+        skip_download=args.skip_download,
+        use_cli=args.use_zenodo_get,
+    )
     raise SystemExit(0 if success else 1)
 
 
@@ -14,6 +14,20 @@ import json
 import sys
 from pathlib import Path
 
+try:  # Optional SIMD base64 decoder; falls back to the stdlib codec.
+    import pybase64
+
+    HAS_PYBASE64 = True
+except ImportError:
+    HAS_PYBASE64 = False
+
+
+def _b64decode(data: str) -> bytes:
+    """Decode base64 text with pybase64 when available, else ``base64``."""
+    if HAS_PYBASE64:
+        return pybase64.b64decode(data, validate=False)
+    return base64.b64decode(data)
+
 
 def decode_and_save(response_data: dict, output_path: str = "meow_output.wav") -> Path:
     """Decode audio_base64 from API response and save as WAV."""
@@ -24,7 +38,7 @@ def decode_and_save(response_data: dict, output_path: str = "meow_output.wav") -
         sys.exit(1)
 
     out = Path(output_path)
-    out.write_bytes(base64.b64decode(audio_b64))
+    out.write_bytes(_b64decode(audio_b64))
 
     # Print summary
     sr = response_data.get("synthesis_metadata", {}).get("sample_rate", "?")